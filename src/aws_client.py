@@ -1,14 +1,32 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, NoCredentialsError
-from .config import get_aws_credentials
+from .config import get_aws_credentials, get_boto3_session
 
+# Shared client configuration for the whole CLI session:
+# - adaptive retries back off client-side when EC2 throttles requests
+# - a sized connection pool with TCP keepalive lets the single client reuse
+#   its HTTPS connections instead of paying a new TLS handshake per call
+_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=25,
+    tcp_keepalive=True,
+    user_agent_extra="reto2-cli/1.0",
+)
 
-def create_ec2_client():
+
+def create_ec2_client(region_name: str | None = None):
     """
     Create and return a configured EC2 client.
     
     This function retrieves AWS credentials from the configuration
-    and creates a boto3 EC2 client with proper error handling.
+    and creates a boto3 EC2 client with proper error handling. The
+    client is meant to be created once and reused for the whole session.
+    
+    Parameters
+    ----------
+    region_name : str, optional
+        Region to target instead of the configured default region.
     
     Returns
     -------
@@ -24,11 +42,22 @@ def create_ec2_client():
     try:
         # Get AWS credentials from environment variables or .env file
         credentials = get_aws_credentials()
+        if region_name:
+            # Copy the read-only cached mapping before overriding the region
+            credentials = {**credentials, "region_name": region_name}
+        
+        if "aws_access_key_id" not in credentials:
+            # Provider chain (profile, SSO, instance metadata): build the
+            # client from the shared session so botocore keeps refreshing
+            # temporary credentials for the whole CLI session
+            return get_boto3_session().client(
+                "ec2", config=_CLIENT_CONFIG, **credentials
+            )
         
         # Create EC2 client using boto3 (AWS SDK for Python)
         # **credentials unpacks the dictionary into keyword arguments
         # This is equivalent to: boto3.client("ec2", aws_access_key_id=..., aws_secret_access_key=..., region_name=...)
-        ec2_client = boto3.client("ec2", **credentials)
+        ec2_client = boto3.client("ec2", config=_CLIENT_CONFIG, **credentials)
         return ec2_client
     except ValueError as exc:
         # ValueError raised when credentials are missing from environment
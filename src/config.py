@@ -1,9 +1,19 @@
 import os  # Access environment variables from the operating system
+from types import MappingProxyType  # Read-only view over a dict
+import boto3  # Clients built from the shared session
+import botocore.session  # Shared session for the default credential chain
 from dotenv import load_dotenv  # Library to load .env file variables
 
 # Load variables from .env file into environment (if file exists)
 load_dotenv()
 
+# Single botocore session whose provider chain (shared config, SSO,
+# container and instance metadata) is used when no env keys are set
+_SESSION = botocore.session.Session()
+
+# One-slot cache holding the read-only credentials mapping
+_CREDENTIALS_CACHE = {}
+
 
 def get_aws_region():
     """
@@ -19,26 +29,64 @@ def get_aws_region():
     return os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
 
-def get_aws_credentials():
+def _load_from_provider_chain():
     """
-    Retrieve AWS credentials from environment variables.
+    Resolve credentials through botocore's default provider chain.
     
-    Credentials are loaded from environment variables or a .env file
-    using python-dotenv.
+    The result is kept on the shared session, so clients built from
+    ``get_boto3_session()`` reuse (and refresh) the same credentials
+    instead of walking the chain again.
+    
+    Returns
+    -------
+    botocore.credentials.Credentials or None
+        Credentials from the shared config/credentials files, SSO, the
+        container provider or instance metadata, or None if none is found.
+    """
+    return _SESSION.get_credentials()
+
+
+def get_boto3_session():
+    """
+    Return a boto3 session wrapping the shared botocore session.
+    
+    Clients created from it use the provider chain's credentials object
+    directly, so temporary credentials (SSO, instance metadata, container,
+    assume-role) are refreshed by botocore before they expire.
+    
+    Returns
+    -------
+    boto3.session.Session
+        Session backed by the module-level botocore session.
+    """
+    return boto3.Session(botocore_session=_SESSION)
+
+
+def _build_credentials():
+    """
+    Resolve AWS credentials into a new dict.
+    
+    Static keys from environment variables (or the .env file) are used
+    directly. When neither key is set, the botocore provider chain is
+    walked instead; its credentials are not copied into the dict, because
+    frozen copies of temporary credentials would never be refreshed.
     
     Returns
     -------
     dict
-        Dictionary containing AWS credentials with keys:
-        - aws_access_key_id
-        - aws_secret_access_key
+        Dictionary with keys:
+        - aws_access_key_id (static env keys only)
+        - aws_secret_access_key (static env keys only)
         - region_name
         - aws_session_token (optional, for temporary credentials)
+        Without the key entries, clients must be built from
+        ``get_boto3_session()``.
     
     Raises
     ------
     ValueError
-        If required credentials (access key or secret key) are missing.
+        If only one of the access key or secret key is set, or no
+        credentials can be found at all.
     """
     # AWS Access Key ID: Public identifier for your AWS account (like a username)
     access_key = os.getenv("AWS_ACCESS_KEY_ID")
@@ -50,11 +98,18 @@ def get_aws_credentials():
     # Used with temporary credentials from AWS STS (Security Token Service)
     session_token = os.getenv("AWS_SESSION_TOKEN")
 
+    if not access_key and not secret_key:
+        # No static keys: fall back to profiles, SSO or instance metadata;
+        # the shared session owns (and refreshes) whatever the chain finds
+        if _load_from_provider_chain() is not None:
+            return {"region_name": get_aws_region()}
+
     # Both access key and secret key are required for AWS authentication
     if not access_key or not secret_key:
         raise ValueError(
             "AWS credentials not found. "
-            "Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in your .env file."
+            "Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in your .env file "
+            "or configure a profile with 'aws configure'."
         )
 
     # Build credentials dictionary with required AWS authentication parameters
@@ -70,3 +125,41 @@ def get_aws_credentials():
         credentials["aws_session_token"] = session_token
     
     return credentials
+
+
+def get_aws_credentials():
+    """
+    Retrieve AWS credentials from the environment or the provider chain.
+    
+    Credentials are loaded from environment variables or a .env file
+    using python-dotenv, falling back to botocore's default provider
+    chain when no keys are set. The result is memoized: later calls
+    return the same read-only mapping without re-reading the environment
+    or re-walking the chain. Use ``reset_credentials_cache()`` to force a
+    fresh lookup.
+    
+    Returns
+    -------
+    types.MappingProxyType
+        Read-only mapping with the keys described in ``_build_credentials``.
+        With static keys it can be unpacked into ``boto3.client(**credentials)``;
+        with only ``region_name`` the client comes from ``get_boto3_session()``.
+    
+    Raises
+    ------
+    ValueError
+        If required credentials (access key or secret key) are missing.
+    """
+    cached = _CREDENTIALS_CACHE.get("credentials")
+    if cached is not None:
+        return cached
+
+    # MappingProxyType prevents callers from mutating the shared cached value
+    mapping = MappingProxyType(_build_credentials())
+    _CREDENTIALS_CACHE["credentials"] = mapping
+    return mapping
+
+
+def reset_credentials_cache():
+    """Discard memoized credentials so the next call re-reads the environment."""
+    _CREDENTIALS_CACHE.clear()
@@ -1,6 +1,128 @@
-from botocore.exceptions import ClientError  # AWS API error handling
+"""
+EC2 instance operations behind the Cloud Instance Manager menu.
+
+Listings, prompts and error details are printed to stdout. The outcome of
+each create/stop/start/reboot/terminate call is logged instead, through
+the ``src.instances_cli`` logger (``logger`` below), and this module adds
+no handler of its own. Callers must configure that logger: ``main()``
+does so with a plain stdout handler. Without it, INFO "Success: ..."
+records are dropped and ERROR records reach stderr through Python's
+fallback handler, apart from the "Details:"/"Hint:" lines on stdout.
+"""
+import logging  # Structured records for action outcomes
+import re  # Regular expressions for validating instance IDs
+from concurrent.futures import ThreadPoolExecutor  # Multi-region fan-out
+from itertools import chain  # Flatten reservations into one instance stream
+import sys  # Direct access to stdout for batched writes
+import time  # Monotonic clock for result cache expiry
+from typing import Iterator
+
+from botocore.exceptions import BotoCoreError, ClientError  # AWS API error handling
 import jmespath  # JSON query language for filtering AWS API responses
 
+# Outcomes of create/stop/start/reboot/terminate are logged rather than
+# printed, so each one is a record carrying the action and instance IDs;
+# main() routes these records to stdout as plain messages
+logger = logging.getLogger(__name__)
+
+# EC2 instance IDs are "i-" followed by 8 (legacy) or 17 hexadecimal characters
+# Compiled once so malformed IDs are rejected locally without an API round-trip
+_ID_RE = re.compile(r"^i-(?:[0-9a-f]{8}|[0-9a-f]{17})$")
+# How _ID_RE is described to the user, in local validation and API hints
+_ID_FORMAT = "i- followed by 8 or 17 hex characters"
+
+# JMESPath expression equivalent to the built-in projection in _iter_instances
+# Navigates: Reservations -> Instances -> individual instance properties
+# Compiled once at import time so each call skips the lexer/parser pass
+_INSTANCE_EXPR = jmespath.compile(
+    "Reservations[].Instances[]."
+    "{id: InstanceId, state: State.Name, type: InstanceType, "
+    "az: Placement.AvailabilityZone}"
+)
+
+# Number of instances requested per describe_instances page
+_PAGE_SIZE = 100
+
+# Formats one instance row; bound once so each row skips the attribute lookup
+_format_row = (
+    "ID: {id:<20} State: {state:<12} Type: {type:<12} AZ: {az}"
+).format_map
+
+# Recent describe_instances results, keyed by (client id, filters), so menu
+# re-entries within a few seconds do not hit the network again; each entry
+# is (expires_at, client, pages) and is only used for that same client
+_CACHE_TTL = 10  # seconds
+_CACHE_MAXSIZE = 8
+_DESCRIBE_CACHE = {}
+
+# Upper bound on threads used to query regions concurrently
+_MAX_REGION_WORKERS = 16
+
+# Shown each time a required prompt is left blank
+_REQUIRED_MSG = "Error: This value is required. Please try again."
+
+# Horizontal rule used to frame every section of CLI output
+_BAR = "=" * 70
+
+# Next-step hints for common EC2 error codes, looked up once per failure;
+# codes not listed here only get the raw error details
+_ERROR_HINTS = {
+    "InvalidInstanceID.NotFound": (
+        "Check the instance ID(s) and that they belong to this region."
+    ),
+    "InvalidInstanceID.Malformed": f"Instance IDs are {_ID_FORMAT}.",
+    "IncorrectInstanceState": (
+        "The instance is not in a state that allows this action yet."
+    ),
+    "InvalidAMIID.NotFound": "Check that the AMI ID exists in this region.",
+    "InvalidAMIID.Malformed": "AMI IDs look like ami-0123456789abcdef0.",
+    "UnauthorizedOperation": "Your IAM permissions do not allow this action.",
+    "AuthFailure": "Check that your AWS credentials are valid and current.",
+    "RequestLimitExceeded": "Too many requests; wait a moment and try again.",
+}
+
+# Short labels for EC2 filter names used in headers and messages
+_FILTER_LABELS = {
+    "instance-state-name": "state",
+    "instance-type": "type",
+    "availability-zone": "az",
+    "tag:Name": "name",
+}
+
+
+def _error_code(exc: ClientError | BotoCoreError) -> str:
+    """Return the EC2 error code carried by a ClientError, or ''."""
+    # BotoCoreError (connection failures, timeouts) has no API response
+    response = getattr(exc, "response", None) or {}
+    return response.get("Error", {}).get("Code", "")
+
+
+def _print_error_details(exc: ClientError | BotoCoreError) -> None:
+    """
+    Print the details of a failed API call plus a hint for known codes.
+    
+    Parameters
+    ----------
+    exc : botocore.exceptions.ClientError or BotoCoreError
+        The error raised by the EC2 client.
+    """
+    print(f"Details: {exc}")
+    hint = _ERROR_HINTS.get(_error_code(exc))
+    if hint:
+        print(f"Hint: {hint}")
+
+
+def _banner(title: str) -> None:
+    """
+    Print a section title framed by horizontal rules in a single write.
+    
+    Parameters
+    ----------
+    title : str
+        The section title to display.
+    """
+    print(f"\n{_BAR}\n{title}\n{_BAR}")
+
 
 def _prompt_non_empty(prompt_text: str) -> str:
     """
@@ -17,112 +139,495 @@ def _prompt_non_empty(prompt_text: str) -> str:
         The non-empty input value from the user.
     """
     while True:
-        value = input(prompt_text).strip()  # Remove leading/trailing whitespace
-        if value:
-            return value
+        value = input(prompt_text)
+        # isspace() rejects blank input without allocating a stripped copy
+        if value and not value.isspace():
+            return value.strip()  # Remove leading/trailing whitespace
         # Loop until user provides non-empty input
-        print("Error: This value is required. Please try again.")
+        print(_REQUIRED_MSG)
+
+
+def _parse_instance_ids(raw: str) -> list[str]:
+    """
+    Split a comma-separated string into validated instance IDs.
+    
+    Parameters
+    ----------
+    raw : str
+        User input such as "i-0abc1234, i-0def5678".
+    
+    Returns
+    -------
+    list[str]
+        Non-empty list of valid instance IDs, in the order they were entered.
+    
+    Raises
+    ------
+    ValueError
+        If no IDs are present or any token is not a valid instance ID.
+    """
+    # Split on commas and drop empty tokens (e.g. trailing commas)
+    ids = [token.strip() for token in raw.split(",") if token.strip()]
+    if not ids:
+        raise ValueError("At least one instance ID is required.")
+    invalid = next((i for i in ids if not _ID_RE.match(i)), None)
+    if invalid is not None:
+        raise ValueError(
+            f"'{invalid}' is not a valid instance ID "
+            f"(expected {_ID_FORMAT})."
+        )
+    return ids
+
+
+def _prompt_instance_ids(prompt_text: str) -> list[str]:
+    """
+    Prompt the user for one or more comma-separated instance IDs.
+    
+    Each ID is checked against the EC2 instance ID format and the user
+    is prompted again if any token is malformed.
+    
+    Parameters
+    ----------
+    prompt_text : str
+        The prompt message to display to the user.
+    
+    Returns
+    -------
+    list[str]
+        Non-empty list of valid instance IDs, in the order they were entered.
+    """
+    while True:
+        try:
+            return _parse_instance_ids(_prompt_non_empty(prompt_text))
+        except ValueError as exc:
+            print(f"Error: {exc} Please try again.")
+
+
+def _resolve_instance_ids(args: tuple[str, ...], prompt_text: str) -> list[str]:
+    """
+    Take instance IDs from command arguments, prompting if none are usable.
+    
+    Parameters
+    ----------
+    args : tuple of str
+        Arguments typed after the menu option, e.g. ("i-0abc1234,i-0def5678",).
+    prompt_text : str
+        Prompt used when no arguments were given or they are invalid.
+    
+    Returns
+    -------
+    list[str]
+        Non-empty list of valid instance IDs.
+    """
+    if args:
+        try:
+            # Accept both "3 i-a,i-b" and "3 i-a i-b"
+            return _parse_instance_ids(",".join(args))
+        except ValueError as exc:
+            print(f"Error: {exc}")
+    return _prompt_instance_ids(prompt_text)
+
+
+def _describe_ids(instance_ids: list[str]) -> str:
+    """
+    Format instance IDs for user messages.
+    
+    Parameters
+    ----------
+    instance_ids : list[str]
+        Instance IDs included in the request.
+    
+    Returns
+    -------
+    str
+        "instance <id>" for a single ID, "instances <id>, <id>" otherwise.
+    """
+    noun = "instance" if len(instance_ids) == 1 else "instances"
+    return f"{noun} {', '.join(instance_ids)}"
+
+
+def _iter_instances(pages, expression=None) -> Iterator[dict]:
+    """
+    Lazily extract instance information from describe_instances pages.
+    
+    Each page is projected as it arrives and its rows are yielded one by
+    one, so at most one page is held in memory. The default projection
+    walks the response dicts directly, which is much cheaper than running
+    the JMESPath interpreter for this fixed shape.
+    
+    Parameters
+    ----------
+    pages : iterable of dict
+        Response pages from the describe_instances API (or paginator).
+    expression : jmespath.parser.ParsedResult, optional
+        Compiled JMESPath expression to use instead of the built-in
+        projection, for callers that need a custom shape.
+    
+    Yields
+    ------
+    dict
+        Instance information with keys: id, state, type, and az
+        (availability zone), or whatever ``expression`` projects.
+    """
+    for page in pages:
+        if expression is not None:
+            # search() returns None when a page has no instances
+            yield from expression.search(page) or ()
+            continue
+        # Same result as _INSTANCE_EXPR, using plain dict subscripts;
+        # chain flattens Reservations[].Instances[] in a single loop
+        instances = chain.from_iterable(
+            reservation.get("Instances", ())
+            for reservation in page.get("Reservations", ())
+        )
+        yield from (
+            {
+                "id": inst["InstanceId"],
+                "state": inst["State"]["Name"],
+                "type": inst["InstanceType"],
+                "az": inst["Placement"]["AvailabilityZone"],
+            }
+            for inst in instances
+        )
+
+
+def build_filters(
+    state: str | None = None,
+    instance_type: str | None = None,
+    availability_zone: str | None = None,
+    name_tag: str | None = None,
+) -> list[dict]:
+    """
+    Build a describe_instances filter list from optional criteria.
+    
+    Parameters
+    ----------
+    state : str, optional
+        Instance state (pending, running, stopping, stopped, terminated).
+    instance_type : str, optional
+        Instance type, e.g. t2.micro.
+    availability_zone : str, optional
+        Availability zone, e.g. us-west-2a.
+    name_tag : str, optional
+        Value of the instance's Name tag.
+    
+    Returns
+    -------
+    list[dict]
+        Filters in the EC2 API shape ({"Name": ..., "Values": [...]}),
+        containing only the criteria that were provided.
+    """
+    # EC2 Filters allow you to query specific instances based on criteria
+    # Filtering server-side means less JSON over the wire and less to project
+    criteria = [
+        ("instance-state-name", state),
+        ("instance-type", instance_type),
+        ("availability-zone", availability_zone),
+        ("tag:Name", name_tag),
+    ]
+    return [
+        {"Name": name, "Values": [value]}
+        for name, value in criteria
+        if value
+    ]
 
 
-def _extract_instances_from_response(response: dict) -> list:
+def _describe_filters(filters: list[dict]) -> str:
     """
-    Extract instance information from EC2 API response using JMESPath.
+    Format a filter list for user messages.
     
     Parameters
     ----------
-    response : dict
-        The response dictionary from EC2 describe_instances API call.
+    filters : list[dict]
+        Filters in the EC2 API shape.
     
     Returns
     -------
-    list
-        List of dictionaries containing instance information with keys:
-        id, state, type, and az (availability zone).
-    """
-    # JMESPath expression to extract specific fields from nested EC2 response
-    # Navigates: Reservations -> Instances -> individual instance properties
-    expression = (
-        "Reservations[].Instances[]."
-        "{id: InstanceId, state: State.Name, type: InstanceType, "
-        "az: Placement.AvailabilityZone}"
+    str
+        Human-readable summary, e.g. "state: running, type: t2.micro".
+    """
+    return ", ".join(
+        f"{_FILTER_LABELS.get(f['Name'], f['Name'])}: {', '.join(f['Values'])}"
+        for f in filters
     )
-    instances = jmespath.search(expression, response)
-    return instances if instances else []  # Return empty list if no instances found
 
 
-def list_instances(ec2_client, state_filter: str | None = None) -> None:
+def _cache_key(ec2_client, filters: list[dict] | None) -> tuple:
+    """
+    Build a hashable cache key for a describe_instances query.
+    
+    Parameters
+    ----------
+    ec2_client
+        Boto3 EC2 client the query is sent with.
+    filters : list[dict] or None
+        EC2 filters for the query.
+    
+    Returns
+    -------
+    tuple
+        Client id plus the filters as sorted tuples, so the same criteria
+        in a different order share one entry. ids can be reused after a
+        client is garbage collected, so entries also store the client.
+    """
+    normalized = tuple(sorted(
+        (f["Name"], tuple(f["Values"])) for f in filters or ()
+    ))
+    return (id(ec2_client), normalized)
+
+
+def _record_pages(key: tuple, ec2_client, pages) -> Iterator[dict]:
+    """
+    Yield pages unchanged and cache them once the last page is consumed.
+    
+    Results are only stored when pagination completes, so an error half
+    way through never leaves a partial listing in the cache.
+    
+    Parameters
+    ----------
+    key : tuple
+        Cache key from ``_cache_key``.
+    ec2_client
+        Client the pages were fetched with, checked on later cache hits.
+    pages : iterable of dict
+        Response pages from the describe_instances paginator.
+    
+    Yields
+    ------
+    dict
+        Each response page as it arrives.
+    """
+    collected = []
+    for page in pages:
+        collected.append(page)
+        yield page
+    # Re-insert refreshed keys so insertion order stays oldest-first, then
+    # evict the oldest entry (dicts keep insertion order) when full
+    _DESCRIBE_CACHE.pop(key, None)
+    if len(_DESCRIBE_CACHE) >= _CACHE_MAXSIZE:
+        del _DESCRIBE_CACHE[next(iter(_DESCRIBE_CACHE))]
+    _DESCRIBE_CACHE[key] = (time.monotonic() + _CACHE_TTL, ec2_client, collected)
+
+
+def clear_instance_cache() -> None:
+    """Discard cached describe_instances results so the next list refetches."""
+    _DESCRIBE_CACHE.clear()
+
+
+def list_instances(ec2_client, filters: list[dict] | None = None) -> None:
     """
     List EC2 instances and display basic information.
     
+    Results are cached for a few seconds per set of filters; use
+    ``clear_instance_cache`` to force a fresh listing.
+    
     Parameters
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
-    state_filter : str, optional
-        Filter instances by state. Valid values include:
-        pending, running, stopping, stopped, terminated.
+    filters : list[dict], optional
+        EC2 filters applied server-side, typically built with
+        ``build_filters`` (state, instance type, availability zone, Name tag).
     """
     try:
-        # EC2 Filters allow you to query specific instances based on criteria
-        # Common filter names: instance-state-name, instance-type, tag:Name, etc.
-        filters = []
-        if state_filter:
-            # Filter by instance state (pending, running, stopping, stopped, terminated)
-            filters.append({
-                "Name": "instance-state-name",
-                "Values": [state_filter]
-            })
-        
-        # Call describe_instances API with or without filters
-        response = ec2_client.describe_instances(Filters=filters) if filters else ec2_client.describe_instances()
-        instances = _extract_instances_from_response(response)
-
-        if not instances:
-            if state_filter:
-                print(f"\nNo instances found in state: {state_filter}")
+        key = _cache_key(ec2_client, filters)
+        cached = _DESCRIBE_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0] > time.monotonic()
+            and cached[1] is ec2_client  # not a new client with a reused id
+        ):
+            pages = cached[2]
+        else:
+            # Paginate describe_instances so large accounts are fetched in
+            # bounded pages instead of one unbounded call (AWS recommends
+            # paginated requests to avoid throttling and timeouts)
+            paginator = ec2_client.get_paginator("describe_instances")
+            params = {"Filters": filters} if filters else {}
+            pages = _record_pages(key, ec2_client, paginator.paginate(
+                **params, PaginationConfig={"PageSize": _PAGE_SIZE}
+            ))
+
+        # Print each page as it arrives; the header is emitted lazily so the
+        # "no instances" message can still be shown when every page is empty
+        found = False
+        for page in pages:
+            lines = [_format_row(inst) for inst in _iter_instances((page,))]
+            if not lines:
+                continue
+            if not found:
+                if filters:
+                    _banner(f"Instances with {_describe_filters(filters)}")
+                else:
+                    _banner("All Instances")
+                found = True
+            # One write per page instead of one print call per instance
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        if not found:
+            if filters:
+                print(f"\nNo instances found with {_describe_filters(filters)}")
             else:
                 print("\nNo instances found in this account or region.")
             return
 
-        print(f"\n{'=' * 70}")
-        if state_filter:
-            print(f"Instances with state: {state_filter}")
-        else:
-            print("All Instances")
-        print("=" * 70)
-        
-        for inst in instances:
-            print(f"ID: {inst['id']:<20} State: {inst['state']:<12} "
-                  f"Type: {inst['type']:<12} AZ: {inst['az']}")
-        print("=" * 70)
+        print(_BAR)
 
     except ClientError as exc:
         print(f"\nError: Failed to list instances.")
-        print(f"Details: {exc}")
+        _print_error_details(exc)
+
+
+def get_enabled_regions(ec2_client) -> list[str]:
+    """
+    Return the regions enabled for the account, sorted by name.
+    
+    Parameters
+    ----------
+    ec2_client
+        Boto3 EC2 client for making API calls.
+    
+    Returns
+    -------
+    list[str]
+        Region names, or an empty list if the request fails.
+    """
+    try:
+        response = ec2_client.describe_regions()
+    except ClientError as exc:
+        print("\nError: Failed to list regions.")
+        _print_error_details(exc)
+        return []
+    return sorted(region["RegionName"] for region in response["Regions"])
 
 
-def create_instance(ec2_client) -> None:
+def resolve_regions(ec2_client, *region_args: str) -> list[str]:
+    """
+    Work out which regions to list from optional user-supplied names.
+    
+    Names are checked against the regions enabled for the account, so a
+    typo is reported at once instead of sitting through retries against
+    an endpoint that does not exist.
+    
+    Parameters
+    ----------
+    ec2_client
+        Boto3 EC2 client used to look up the enabled regions.
+    *region_args : str
+        Region names (space- or comma-separated); every enabled region
+        is used when none are given.
+    
+    Returns
+    -------
+    list[str]
+        Enabled regions to list, in the order given; unknown names are
+        reported and skipped. Empty if nothing is left or the lookup fails.
+    """
+    enabled = get_enabled_regions(ec2_client)
+    if not region_args:
+        return enabled
+    # Nothing can be validated when the lookup failed (already reported)
+    if not enabled:
+        return []
+
+    requested = [
+        r.strip() for r in ",".join(region_args).split(",") if r.strip()
+    ]
+    unknown = [r for r in requested if r not in enabled]
+    if unknown:
+        print(f"Error: Not an enabled region: {', '.join(unknown)}")
+    return [r for r in requested if r in enabled]
+
+
+def _fetch_region_rows(ec2_client) -> list[str]:
+    """
+    Fetch and format every instance visible to one regional client.
+    
+    Parameters
+    ----------
+    ec2_client
+        Boto3 EC2 client bound to a single region.
+    
+    Returns
+    -------
+    list[str]
+        Formatted output rows, one per instance.
+    """
+    paginator = ec2_client.get_paginator("describe_instances")
+    pages = paginator.paginate(PaginationConfig={"PageSize": _PAGE_SIZE})
+    return [_format_row(inst) for inst in _iter_instances(pages)]
+
+
+def list_instances_in_regions(clients: dict) -> None:
+    """
+    List EC2 instances in several regions concurrently.
+    
+    Each region is queried on its own thread, so the total wait is the
+    slowest region rather than the sum of all of them. Results are
+    printed region by region, in the order given, as soon as each one
+    is ready.
+    
+    Parameters
+    ----------
+    clients : dict
+        Mapping of region name to a Boto3 EC2 client for that region.
+        Clients should be created up front on the calling thread.
+    """
+    if not clients:
+        print("\nNo regions to list.")
+        return
+
+    _banner(f"Instances in {len(clients)} region(s)")
+    workers = min(_MAX_REGION_WORKERS, len(clients))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            region: executor.submit(_fetch_region_rows, client)
+            for region, client in clients.items()
+        }
+        for region, future in futures.items():
+            try:
+                lines = future.result()
+            except (ClientError, BotoCoreError) as exc:
+                # One failing region should not hide the others, whether
+                # the API refused the call or the endpoint was unreachable
+                print(f"\n[{region}] Error: Failed to list instances.")
+                _print_error_details(exc)
+                continue
+            print(f"\n[{region}] {len(lines)} instance(s)")
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+    print(_BAR)
+
+
+def create_instance(
+    ec2_client,
+    ami_id: str | None = None,
+    instance_type: str | None = None,
+) -> None:
     """
     Create a new EC2 instance.
     
-    Prompts the user for AMI ID and instance type, then creates
-    a single instance with the specified configuration.
+    Prompts the user for AMI ID and instance type (unless given as
+    arguments), then creates a single instance with the specified
+    configuration.
     
     Parameters
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
+    ami_id : str, optional
+        AMI ID to launch; prompted for when omitted.
+    instance_type : str, optional
+        Instance type to launch; prompted for when omitted.
     """
-    print("\n" + "=" * 70)
-    print("Create EC2 Instance")
-    print("=" * 70)
+    _banner("Create EC2 Instance")
     print("Note: Use Free Tier eligible options (t2.micro or t3.micro)")
     print()
     
-    ami_id = _prompt_non_empty(
+    ami_id = ami_id or _prompt_non_empty(
         "AMI ID (example for us-west-2 AL2023: ami-0b8c6b923777519db): "
     )
-    instance_type = _prompt_non_empty(
+    instance_type = instance_type or _prompt_non_empty(
         "Instance type (Free Tier: t2.micro or t3.micro): "
     )
 
@@ -139,98 +644,157 @@ def create_instance(ec2_client) -> None:
         )
         # Extract the new instance ID from the API response
         instance_id = response["Instances"][0]["InstanceId"]
-        print(f"\nSuccess: Instance created with ID: {instance_id}")
-        print("=" * 70)
+        clear_instance_cache()  # Cached listings no longer reflect the account
+        print()
+        logger.info(
+            "Success: Instance created with ID: %s", instance_id,
+            extra={"action": "create", "instance_ids": [instance_id]},
+        )
+        print(_BAR)
     except ClientError as exc:
-        print(f"\nError: Failed to create instance.")
-        print(f"Details: {exc}")
-        print("=" * 70)
+        print()
+        logger.error(
+            "Error: Failed to create instance.",
+            extra={"action": "create", "error_code": _error_code(exc)},
+        )
+        _print_error_details(exc)
+        print(_BAR)
 
 
-def stop_instance(ec2_client) -> None:
+def stop_instance(ec2_client, *instance_args: str) -> None:
     """
-    Stop a running EC2 instance.
+    Stop one or more running EC2 instances.
     
     Parameters
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
+    *instance_args : str
+        Instance IDs passed inline (space- or comma-separated); the user
+        is prompted when none are given.
     """
-    print("\n" + "=" * 70)
-    print("Stop EC2 Instance")
-    print("=" * 70)
-    instance_id = _prompt_non_empty("Instance ID to stop: ")
+    _banner("Stop EC2 Instance")
+    # Accept several IDs so the whole batch is sent in a single API request
+    instance_ids = _resolve_instance_ids(
+        instance_args, "Instance ID(s) to stop (comma-separated): "
+    )
 
     try:
         # stop_instances: Stops a running instance (data on EBS volumes persists)
         # Stopped instances do not incur compute charges but storage charges still apply
-        # InstanceIds expects a list, even for a single instance
-        ec2_client.stop_instances(InstanceIds=[instance_id])
-        print(f"\nSuccess: Stop request sent for instance {instance_id}")
-        print("=" * 70)
+        # InstanceIds accepts a list, so all IDs share one round-trip
+        ec2_client.stop_instances(InstanceIds=instance_ids)
+        clear_instance_cache()  # Instance states are about to change
+        print()
+        logger.info(
+            "Success: Stop request sent for %s", _describe_ids(instance_ids),
+            extra={"action": "stop", "instance_ids": instance_ids},
+        )
+        print(_BAR)
     except ClientError as exc:
-        print(f"\nError: Failed to stop instance {instance_id}")
-        print(f"Details: {exc}")
-        print("=" * 70)
+        print()
+        logger.error(
+            "Error: Failed to stop %s", _describe_ids(instance_ids),
+            extra={
+                "action": "stop",
+                "instance_ids": instance_ids,
+                "error_code": _error_code(exc),
+            },
+        )
+        _print_error_details(exc)
+        print(_BAR)
 
 
-def start_instance(ec2_client) -> None:
+def start_instance(ec2_client, *instance_args: str) -> None:
     """
-    Start a stopped EC2 instance.
+    Start one or more stopped EC2 instances.
     
     Parameters
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
+    *instance_args : str
+        Instance IDs passed inline (space- or comma-separated); the user
+        is prompted when none are given.
     """
-    print("\n" + "=" * 70)
-    print("Start EC2 Instance")
-    print("=" * 70)
-    instance_id = _prompt_non_empty("Instance ID to start: ")
+    _banner("Start EC2 Instance")
+    # Accept several IDs so the whole batch is sent in a single API request
+    instance_ids = _resolve_instance_ids(
+        instance_args, "Instance ID(s) to start (comma-separated): "
+    )
 
     try:
         # start_instances: Starts a previously stopped instance
         # The instance retains its instance ID, private IP, and EBS volumes
         # May receive a new public IP address unless using Elastic IP
-        ec2_client.start_instances(InstanceIds=[instance_id])
-        print(f"\nSuccess: Start request sent for instance {instance_id}")
-        print("=" * 70)
+        ec2_client.start_instances(InstanceIds=instance_ids)
+        clear_instance_cache()  # Instance states are about to change
+        print()
+        logger.info(
+            "Success: Start request sent for %s", _describe_ids(instance_ids),
+            extra={"action": "start", "instance_ids": instance_ids},
+        )
+        print(_BAR)
     except ClientError as exc:
-        print(f"\nError: Failed to start instance {instance_id}")
-        print(f"Details: {exc}")
-        print("=" * 70)
+        print()
+        logger.error(
+            "Error: Failed to start %s", _describe_ids(instance_ids),
+            extra={
+                "action": "start",
+                "instance_ids": instance_ids,
+                "error_code": _error_code(exc),
+            },
+        )
+        _print_error_details(exc)
+        print(_BAR)
 
 
-def reboot_instance(ec2_client) -> None:
+def reboot_instance(ec2_client, *instance_args: str) -> None:
     """
-    Reboot a running EC2 instance.
+    Reboot one or more running EC2 instances.
     
     Parameters
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
+    *instance_args : str
+        Instance IDs passed inline (space- or comma-separated); the user
+        is prompted when none are given.
     """
-    print("\n" + "=" * 70)
-    print("Reboot EC2 Instance")
-    print("=" * 70)
-    instance_id = _prompt_non_empty("Instance ID to reboot: ")
+    _banner("Reboot EC2 Instance")
+    # Accept several IDs so the whole batch is sent in a single API request
+    instance_ids = _resolve_instance_ids(
+        instance_args, "Instance ID(s) to reboot (comma-separated): "
+    )
 
     try:
         # reboot_instances: Performs an OS-level reboot of the instance
         # The instance maintains its public and private IP addresses
         # Similar to rebooting your computer - temporary interruption only
-        ec2_client.reboot_instances(InstanceIds=[instance_id])
-        print(f"\nSuccess: Reboot request sent for instance {instance_id}")
-        print("=" * 70)
+        ec2_client.reboot_instances(InstanceIds=instance_ids)
+        print()
+        logger.info(
+            "Success: Reboot request sent for %s", _describe_ids(instance_ids),
+            extra={"action": "reboot", "instance_ids": instance_ids},
+        )
+        print(_BAR)
     except ClientError as exc:
-        print(f"\nError: Failed to reboot instance {instance_id}")
-        print(f"Details: {exc}")
-        print("=" * 70)
+        print()
+        logger.error(
+            "Error: Failed to reboot %s", _describe_ids(instance_ids),
+            extra={
+                "action": "reboot",
+                "instance_ids": instance_ids,
+                "error_code": _error_code(exc),
+            },
+        )
+        _print_error_details(exc)
+        print(_BAR)
 
 
-def terminate_instance(ec2_client) -> None:
+def terminate_instance(ec2_client, *instance_args: str) -> None:
     """
-    Terminate an EC2 instance.
+    Terminate one or more EC2 instances.
     
     Warning: Terminated instances cannot be recovered or restarted.
     
@@ -238,33 +802,50 @@ def terminate_instance(ec2_client) -> None:
     ----------
     ec2_client
         Boto3 EC2 client for making API calls.
+    *instance_args : str
+        Instance IDs passed inline (space- or comma-separated); the user
+        is prompted when none are given.
     """
-    print("\n" + "=" * 70)
-    print("Terminate EC2 Instance")
-    print("=" * 70)
+    _banner("Terminate EC2 Instance")
     print("WARNING: This action cannot be undone!")
     
-    instance_id = _prompt_non_empty("Instance ID to terminate: ")
+    # Accept several IDs so the whole batch is sent in a single API request
+    instance_ids = _resolve_instance_ids(
+        instance_args, "Instance ID(s) to terminate (comma-separated): "
+    )
 
     confirmation = input(
-        f"\nAre you sure you want to terminate {instance_id}?\n"
+        f"\nAre you sure you want to terminate {', '.join(instance_ids)}?\n"
         "Type 'yes' to confirm: "
     ).strip().lower()
 
     # User confirmation required because termination is permanent
     if confirmation != "yes":
         print("\nTermination cancelled.")
-        print("=" * 70)
+        print(_BAR)
         return
 
     try:
         # terminate_instances: Permanently deletes the instance
         # Cannot be undone - instance and its data are permanently deleted
         # EBS volumes may be retained if configured with DeleteOnTermination=false
-        ec2_client.terminate_instances(InstanceIds=[instance_id])
-        print(f"\nSuccess: Terminate request sent for instance {instance_id}")
-        print("=" * 70)
+        ec2_client.terminate_instances(InstanceIds=instance_ids)
+        clear_instance_cache()  # Instance states are about to change
+        print()
+        logger.info(
+            "Success: Terminate request sent for %s", _describe_ids(instance_ids),
+            extra={"action": "terminate", "instance_ids": instance_ids},
+        )
+        print(_BAR)
     except ClientError as exc:
-        print(f"\nError: Failed to terminate instance {instance_id}")
-        print(f"Details: {exc}")
-        print("=" * 70)
+        print()
+        logger.error(
+            "Error: Failed to terminate %s", _describe_ids(instance_ids),
+            extra={
+                "action": "terminate",
+                "instance_ids": instance_ids,
+                "error_code": _error_code(exc),
+            },
+        )
+        _print_error_details(exc)
+        print(_BAR)
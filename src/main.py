@@ -1,9 +1,25 @@
+import logging  # Show action outcomes logged by instances_cli
+import shlex  # Shell-style splitting of the command line
+import sys
+
+try:
+    # Importing readline enables line editing and history for input()
+    import readline  # noqa: F401
+except ImportError:
+    # readline is not available on Windows; input() still works without it
+    pass
+
 # Import EC2 client creation function
 from .aws_client import create_ec2_client
 
 # Import all CLI operation functions for instance management
 from .instances_cli import (
+    build_filters,
+    clear_instance_cache,
     list_instances,
+    list_instances_in_regions,
+    logger as instances_logger,
+    resolve_regions,
     create_instance,
     stop_instance,
     start_instance,
@@ -11,6 +27,30 @@ from .instances_cli import (
     terminate_instance,
 )
 
+# EC2 instance lifecycle states accepted by the state filter
+_VALID_STATES = frozenset(
+    {"pending", "running", "stopping", "stopped", "terminated"}
+)
+
+
+def _configure_logging():
+    """
+    Print action outcomes logged by instances_cli as plain CLI output.
+    
+    Safe to call more than once: the handler is only attached if the
+    logger has none yet, so outcome lines are never duplicated.
+    """
+    if instances_logger.handlers:
+        # Already configured, by an earlier main() call or an embedding script
+        return
+    # Only this module's records: a root-level INFO handler would also
+    # surface botocore's own INFO messages (e.g. where credentials came from)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    instances_logger.addHandler(handler)
+    instances_logger.setLevel(logging.INFO)
+    instances_logger.propagate = False
+
 
 def print_menu():
     """Show the main menu of the Cloud Instance Manager."""
@@ -19,47 +59,132 @@ def print_menu():
     print("Cloud Instance Manager")
     print("=" * 50)
     print("1. List all instances")
-    print("2. Create new instance")
-    print("3. Stop instance")
-    print("4. Start instance")
-    print("5. Reboot instance")
-    print("6. Terminate instance")
-    print("7. Filter instances by state")
+    print("2. Create new instance       [ami-id] [type]")
+    print("3. Stop instance             [instance-ids]")
+    print("4. Start instance            [instance-ids]")
+    print("5. Reboot instance           [instance-ids]")
+    print("6. Terminate instance        [instance-ids]")
+    print("7. Filter instances          [state] [type] [az] [name]")
+    print("8. Refresh (discard cached listings)")
+    print("9. List instances in all regions [regions]")
     print("0. Exit")
     print("=" * 50)
+    print("Tip: arguments can follow the option, e.g. 3 i-0abc1234,i-0def5678")
+
+
+def handle_list_all(ec2_client, *args):
+    """Handle the list all instances option."""
+    list_instances(ec2_client)
 
 
-def handle_filter_by_state(ec2_client):
-    """Handle the filter by state option."""
+def handle_filter_by_state(ec2_client, *args):
+    """
+    Handle the filter option (state plus optional type, AZ and Name tag).
+
+    When arguments are given they are used in order as state, instance
+    type, availability zone and Name tag, and no prompts are shown.
+    """
     print("\n" + "=" * 50)
-    print("Filter Instances by State")
+    print("Filter Instances")
     print("=" * 50)
-    # EC2 Instance Lifecycle States (for Cloud Practitioner exam):
-    print("Available states:")
-    print("  - pending")      # Instance is launching
-    print("  - running")      # Instance is active and billable
-    print("  - stopping")     # Instance is shutting down
-    print("  - stopped")      # Instance is stopped (no compute charges)
-    print("  - terminated")   # Instance is permanently deleted
-    
-    state = input("\nEnter state to filter by: ").strip().lower()
-    
+
+    if args:
+        # main() rejects more than four arguments (see _MAX_ARGS)
+        state, instance_type, availability_zone, name_tag = (
+            list(args) + [""] * (4 - len(args))
+        )
+        state = state.lower()
+    else:
+        # EC2 Instance Lifecycle States (for Cloud Practitioner exam):
+        print("Available states:")
+        print("  - pending")      # Instance is launching
+        print("  - running")      # Instance is active and billable
+        print("  - stopping")     # Instance is shutting down
+        print("  - stopped")      # Instance is stopped (no compute charges)
+        print("  - terminated")   # Instance is permanently deleted
+
+        state = input("\nEnter state to filter by: ").strip().lower()
+
     if not state:
         print("Error: State cannot be empty.")
         return
-    
+
     # Validate state against known EC2 instance states
-    valid_states = ["pending", "running", "stopping", "stopped", "terminated"]
-    if state not in valid_states:
+    if state not in _VALID_STATES:
         print(f"Warning: '{state}' might not be a valid state.")
         print("Proceeding anyway...")
-    
-    # Call list_instances with state filter
-    list_instances(ec2_client, state_filter=state)
+
+    if not args:
+        # Optional extra criteria, all applied server-side by EC2
+        print("\nOptional filters (press Enter to skip):")
+        instance_type = input("Instance type (e.g. t2.micro): ").strip()
+        availability_zone = input("Availability zone (e.g. us-west-2a): ").strip()
+        name_tag = input("Name tag: ").strip()
+
+    filters = build_filters(
+        state=state,
+        instance_type=instance_type,
+        availability_zone=availability_zone,
+        name_tag=name_tag,
+    )
+    list_instances(ec2_client, filters=filters)
+
+
+def handle_refresh(ec2_client, *args):
+    """Handle the refresh option by discarding cached listings."""
+    clear_instance_cache()
+    print("\nCached instance listings cleared; the next list will refetch.")
+
+
+def handle_all_regions(ec2_client, *args):
+    """
+    Handle the multi-region listing option.
+
+    Regions can be given as arguments (space- or comma-separated);
+    otherwise every region enabled for the account is listed.
+    """
+    regions = resolve_regions(ec2_client, *args)
+    if not regions:
+        return
+
+    try:
+        # Create the clients here, on the main thread, then share them
+        clients = {region: create_ec2_client(region) for region in regions}
+    except SystemExit:
+        # create_ec2_client already printed the reason
+        return
+    list_instances_in_regions(clients)
+
+
+# Menu option -> handler; every handler takes the client plus any
+# arguments typed after the option on the same line
+_DISPATCH = {
+    "1": handle_list_all,           # List all instances
+    "2": create_instance,           # Launch new instance
+    "3": stop_instance,             # Stop running instances
+    "4": start_instance,            # Start stopped instances
+    "5": reboot_instance,           # Reboot running instances
+    "6": terminate_instance,        # Permanently delete instances
+    "7": handle_filter_by_state,    # Filter by state and more
+    "8": handle_refresh,            # Clear cached describe_instances results
+    "9": handle_all_regions,        # List instances across regions
+}
+
+# Most arguments each option accepts; options not listed take any number
+# (instance IDs or regions). Checked in one place so every handler treats
+# extra arguments the same way
+_MAX_ARGS = {
+    "1": 0,  # no arguments
+    "2": 2,  # [ami-id] [type]
+    "7": 4,  # [state] [type] [az] [name]
+    "8": 0,  # no arguments
+}
 
 
 def main():
     """Entry point for the CLI application."""
+    _configure_logging()
+
     try:
         # Initialize EC2 client with credentials from environment
         ec2_client = create_ec2_client()
@@ -71,28 +196,35 @@ def main():
     while True:
         try:
             print_menu()
-            option = input("Select an option: ").strip()
+            line = input("Select an option: ")
 
-            # Route user choice to appropriate function
-            if option == "1":
-                list_instances(ec2_client)  # List all instances
-            elif option == "2":
-                create_instance(ec2_client)  # Launch new instance
-            elif option == "3":
-                stop_instance(ec2_client)  # Stop running instance
-            elif option == "4":
-                start_instance(ec2_client)  # Start stopped instance
-            elif option == "5":
-                reboot_instance(ec2_client)  # Reboot running instance
-            elif option == "6":
-                terminate_instance(ec2_client)  # Permanently delete instance
-            elif option == "7":
-                handle_filter_by_state(ec2_client)  # Filter by state
-            elif option == "0":
+            # Parse the whole line once: option first, then its arguments
+            try:
+                tokens = shlex.split(line)
+            except ValueError as exc:
+                # e.g. an unterminated quote
+                print(f"Error: Could not parse input: {exc}")
+                continue
+            if not tokens:
+                print("Error: '' is not a valid option.")
+                continue
+            option, args = tokens[0], tokens[1:]
+
+            if option == "0":
                 print("\nExiting Cloud Instance Manager. Goodbye!")
                 break  # Exit the while loop
-            else:
+
+            # Route user choice to appropriate function
+            handler = _DISPATCH.get(option)
+            if handler is None:
                 print(f"Error: '{option}' is not a valid option.")
+                continue
+            max_args = _MAX_ARGS.get(option)
+            if max_args is not None and len(args) > max_args:
+                limit = f"at most {max_args} argument(s)" if max_args else "no arguments"
+                print(f"Error: option {option} takes {limit}; see the menu for usage.")
+                continue
+            handler(ec2_client, *args)
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully (user interruption)
             print("\n\nOperation cancelled by user.")
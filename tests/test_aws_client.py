@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from botocore.exceptions import BotoCoreError, NoCredentialsError
-from src.aws_client import create_ec2_client
+from src.aws_client import _CLIENT_CONFIG, create_ec2_client
 
 
 class TestCreateEC2Client:
@@ -25,6 +25,7 @@ class TestCreateEC2Client:
         mock_get_creds.assert_called_once()
         mock_boto_client.assert_called_once_with(
             "ec2",
+            config=_CLIENT_CONFIG,
             aws_access_key_id="test_key",
             aws_secret_access_key="test_secret",
             region_name="us-west-2"
@@ -108,8 +109,59 @@ class TestCreateEC2Client:
         assert result == mock_client
         mock_boto_client.assert_called_once_with(
             "ec2",
+            config=_CLIENT_CONFIG,
             aws_access_key_id="test_key",
             aws_secret_access_key="test_secret",
             aws_session_token="test_token",
             region_name="us-west-2"
         )
+
+    @patch('src.aws_client.get_aws_credentials')
+    @patch('src.aws_client.boto3.client')
+    def test_create_ec2_client_region_override(
+        self, mock_boto_client, mock_get_creds
+    ):
+        # Arrange
+        mock_get_creds.return_value = {
+            "aws_access_key_id": "test_key",
+            "aws_secret_access_key": "test_secret",
+            "region_name": "us-west-2"
+        }
+        
+        # Act
+        create_ec2_client("eu-west-1")
+        
+        # Assert - same credentials, different region
+        mock_boto_client.assert_called_once_with(
+            "ec2",
+            config=_CLIENT_CONFIG,
+            aws_access_key_id="test_key",
+            aws_secret_access_key="test_secret",
+            region_name="eu-west-1"
+        )
+
+    @patch('src.aws_client.get_boto3_session')
+    @patch('src.aws_client.get_aws_credentials')
+    @patch('src.aws_client.boto3.client')
+    def test_create_ec2_client_from_provider_chain(
+        self, mock_boto_client, mock_get_creds, mock_get_session
+    ):
+        # Arrange - the chain was used, so only the region is returned
+        mock_get_creds.return_value = {"region_name": "us-west-2"}
+        session_client = mock_get_session.return_value.client
+        
+        # Act
+        result = create_ec2_client("eu-west-1")
+        
+        # Assert - built from the shared session, without frozen keys
+        assert result is session_client.return_value
+        mock_boto_client.assert_not_called()
+        session_client.assert_called_once_with(
+            "ec2", config=_CLIENT_CONFIG, region_name="eu-west-1"
+        )
+
+    def test_client_config_retries_and_pool(self):
+        # Assert - adaptive retries and a sized, keepalive connection pool
+        assert _CLIENT_CONFIG.retries == {"mode": "adaptive", "max_attempts": 10}
+        assert _CLIENT_CONFIG.max_pool_connections == 25
+        assert _CLIENT_CONFIG.tcp_keepalive is True
@@ -1,7 +1,29 @@
 import os
 import pytest
-from unittest.mock import patch
-from src.config import get_aws_credentials
+from unittest.mock import Mock, patch
+from botocore.credentials import Credentials
+from src import config
+from src.config import (
+    _load_from_provider_chain,
+    get_aws_credentials,
+    get_boto3_session,
+    reset_credentials_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials_cache():
+    # Credentials are memoized; reset so each test reads its patched env
+    reset_credentials_cache()
+    yield
+    reset_credentials_cache()
+
+
+@pytest.fixture(autouse=True)
+def provider_chain():
+    # Keep tests hermetic: never read ~/.aws or query instance metadata
+    with patch('src.config._load_from_provider_chain', return_value=None) as mock_chain:
+        yield mock_chain
 
 
 class TestGetAWSCredentials:
@@ -92,3 +114,86 @@ class TestGetAWSCredentials:
         
         # Assert - should use default region
         assert credentials["region_name"] == "us-east-1"
+
+    @patch.dict(os.environ, {
+        "AWS_ACCESS_KEY_ID": "test_access_key",
+        "AWS_SECRET_ACCESS_KEY": "test_secret_key"
+    }, clear=True)
+    def test_credentials_are_memoized(self):
+        # Act
+        first = get_aws_credentials()
+        os.environ["AWS_ACCESS_KEY_ID"] = "changed_key"
+        second = get_aws_credentials()
+        
+        # Assert - cached value returned until the cache is cleared
+        assert second is first
+        assert second["aws_access_key_id"] == "test_access_key"
+        reset_credentials_cache()
+        assert get_aws_credentials()["aws_access_key_id"] == "changed_key"
+
+    @patch.dict(os.environ, {
+        "AWS_ACCESS_KEY_ID": "test_access_key",
+        "AWS_SECRET_ACCESS_KEY": "test_secret_key"
+    }, clear=True)
+    def test_credentials_are_read_only(self):
+        # Act
+        credentials = get_aws_credentials()
+        
+        # Assert - the shared cached mapping cannot be mutated by callers
+        with pytest.raises(TypeError):
+            credentials["region_name"] = "eu-west-1"
+
+    @patch.dict(os.environ, {"AWS_DEFAULT_REGION": "eu-west-1"}, clear=True)
+    def test_credentials_from_provider_chain(self, provider_chain):
+        # Arrange - no env keys, so the chain (profile/SSO/IMDS) is used
+        provider_chain.return_value = Credentials(
+            "chain_key", "chain_secret", "chain_token"
+        )
+        
+        # Act
+        credentials = get_aws_credentials()
+        
+        # Assert - only the region; the shared session owns the keys
+        assert dict(credentials) == {"region_name": "eu-west-1"}
+        provider_chain.assert_called_once()
+
+    @patch.dict(os.environ, {
+        "AWS_ACCESS_KEY_ID": "test_access_key",
+        "AWS_SECRET_ACCESS_KEY": "test_secret_key"
+    }, clear=True)
+    def test_env_keys_skip_provider_chain(self, provider_chain):
+        # Act
+        get_aws_credentials()
+        
+        # Assert
+        provider_chain.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_chain_credentials_are_not_frozen(self, provider_chain):
+        # Arrange - temporary credentials, e.g. from SSO or instance metadata
+        resolved = Mock()
+        provider_chain.return_value = resolved
+        
+        # Act
+        first = get_aws_credentials()
+        second = get_aws_credentials()
+        
+        # Assert - no static copy is taken, so botocore can keep refreshing
+        resolved.get_frozen_credentials.assert_not_called()
+        assert second is first
+        provider_chain.assert_called_once()
+
+    @patch('src.config._SESSION')
+    def test_load_from_provider_chain_uses_shared_session(self, mock_session):
+        # Act
+        result = _load_from_provider_chain()
+        
+        # Assert
+        assert result is mock_session.get_credentials.return_value
+
+    def test_boto3_session_wraps_shared_session(self):
+        # Act
+        session = get_boto3_session()
+        
+        # Assert - same botocore session, so the same credentials object
+        assert session._session is config._SESSION
@@ -1,9 +1,24 @@
+import functools
+import json
+import logging
+import jmespath
 import pytest
 from unittest.mock import Mock, patch, call
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
+from src import instances_cli as ic
 from src.instances_cli import (
     _prompt_non_empty,
-    _extract_instances_from_response,
+    _prompt_instance_ids,
+    _resolve_instance_ids,
+    _ID_RE,
+    _INSTANCE_EXPR,
+    _print_error_details,
+    build_filters,
+    clear_instance_cache,
+    get_enabled_regions,
+    resolve_regions,
+    list_instances_in_regions,
+    _iter_instances,
     list_instances,
     create_instance,
     stop_instance,
@@ -13,6 +28,185 @@ from src.instances_cli import (
 )
 
 
+# Pre-built API errors; side_effect re-raises the same instance each time
+_ERR_NOT_FOUND = ClientError(
+    {"Error": {"Code": "InvalidInstanceID.NotFound"}}, "Operation"
+)
+_ERR_UNAUTHORIZED = ClientError(
+    {"Error": {"Code": "UnauthorizedOperation"}}, "Operation"
+)
+_ERR_AUTH_FAILURE = ClientError({"Error": {"Code": "AuthFailure"}}, "Operation")
+_ERR_THROTTLING = ClientError({"Error": {"Code": "Throttling"}}, "Operation")
+_ERR_AMI_MALFORMED = ClientError(
+    {"Error": {"Code": "InvalidAMIID.Malformed"}}, "RunInstances"
+)
+
+
+@functools.cache
+def _resp(id_, state, type_, az):
+    """
+    Build a describe_instances page holding a single instance.
+    
+    Cached, so tests asking for the same instance share one dict; this is
+    safe because neither the tests nor the code under test mutate pages.
+    """
+    return {
+        "Reservations": [
+            {
+                "Instances": [
+                    {
+                        "InstanceId": id_,
+                        "State": {"Name": state},
+                        "InstanceType": type_,
+                        "Placement": {"AvailabilityZone": az}
+                    }
+                ]
+            }
+        ]
+    }
+
+
+# Canned describe_instances pages shared by the listing tests; built once
+# per module and never mutated by the code under test
+_RESP_ONE_RUNNING = _resp(
+    "i-0123456789abcdef0", "running", "t2.micro", "us-west-2a"
+)
+_RESP_EMPTY = {"Reservations": []}
+_RESP_TWO_INSTANCES = {
+    "Reservations": [
+        {
+            "Instances": [
+                {
+                    "InstanceId": "i-123",
+                    "State": {"Name": "running"},
+                    "InstanceType": "t2.micro",
+                    "Placement": {"AvailabilityZone": "us-west-2a"}
+                },
+                {
+                    "InstanceId": "i-456",
+                    "State": {"Name": "stopped"},
+                    "InstanceType": "t2.small",
+                    "Placement": {"AvailabilityZone": "us-west-2b"}
+                }
+            ]
+        }
+    ]
+}
+_RESP_MULTI_RESERVATION = {
+    "Reservations": [
+        {
+            "Instances": [
+                {
+                    "InstanceId": "i-111",
+                    "State": {"Name": "running"},
+                    "InstanceType": "t2.micro",
+                    "Placement": {"AvailabilityZone": "us-west-2a"}
+                }
+            ]
+        },
+        {
+            "Instances": [
+                {
+                    "InstanceId": "i-222",
+                    "State": {"Name": "stopped"},
+                    "InstanceType": "t3.micro",
+                    "Placement": {"AvailabilityZone": "us-west-2b"}
+                }
+            ]
+        }
+    ]
+}
+
+# (response, expected instance IDs) for the projection tests
+_ITER_CASES = [
+    (_RESP_TWO_INSTANCES, ["i-123", "i-456"]),
+    (_RESP_EMPTY, []),
+    ({}, []),
+    (_RESP_MULTI_RESERVATION, ["i-111", "i-222"]),
+]
+
+
+@pytest.fixture(scope="module")
+def running_response():
+    return _RESP_ONE_RUNNING
+
+
+@pytest.fixture(scope="module")
+def empty_response():
+    return _RESP_EMPTY
+
+
+@pytest.fixture(autouse=True)
+def clear_describe_cache():
+    # Listings are cached per client id; start every test with an empty cache
+    clear_instance_cache()
+    yield
+    clear_instance_cache()
+
+
+@pytest.fixture
+def prompt(monkeypatch, request):
+    """Answer every _prompt_non_empty call with the parametrized value."""
+    monkeypatch.setattr(ic, "_prompt_non_empty", lambda _prompt: request.param)
+    return request.param
+
+
+@pytest.fixture
+def outcomes(caplog):
+    """Capture the action outcome records logged by instances_cli."""
+    caplog.set_level(logging.INFO, logger=ic.logger.name)
+    return caplog
+
+
+class FakeEC2:
+    """
+    Minimal stand-in for the EC2 client used by the create/lifecycle tests.
+    
+    Records every call as (method, kwargs) and raises the exception
+    configured for a method in ``errors``, if any.
+    """
+
+    __slots__ = ("calls", "errors", "run_instances_response")
+
+    def __init__(self, run_instances_response=None, errors=None):
+        self.calls = []
+        self.errors = errors or {}
+        self.run_instances_response = run_instances_response
+
+    def _record(self, method, kwargs):
+        self.calls.append((method, kwargs))
+        if method in self.errors:
+            raise self.errors[method]
+        return {}
+
+    def run_instances(self, **kwargs):
+        self._record("run_instances", kwargs)
+        return self.run_instances_response
+
+    def stop_instances(self, **kwargs):
+        return self._record("stop_instances", kwargs)
+
+    def start_instances(self, **kwargs):
+        return self._record("start_instances", kwargs)
+
+    def reboot_instances(self, **kwargs):
+        return self._record("reboot_instances", kwargs)
+
+    def terminate_instances(self, **kwargs):
+        return self._record("terminate_instances", kwargs)
+
+    def assert_called_once_with(self, method, **kwargs):
+        calls = [call_kwargs for name, call_kwargs in self.calls if name == method]
+        assert calls == [kwargs], f"{method} calls: {calls}"
+
+
+def _mock_client_with_pages(*pages):
+    """Build a mock EC2 client whose describe_instances paginator yields pages."""
+    mock_client = Mock()
+    mock_client.get_paginator.return_value.paginate.return_value = list(pages)
+    return mock_client
+
+
 class TestPromptNonEmpty:
     @patch('builtins.input', return_value="valid_input")
     def test_prompt_non_empty_valid_input(self, mock_input):
@@ -23,14 +217,17 @@ class TestPromptNonEmpty:
         assert result == "valid_input"
         mock_input.assert_called_once_with("Enter value: ")
 
-    @patch('builtins.input', side_effect=["", "  ", "valid_input"])
-    def test_prompt_non_empty_retry_on_empty(self, mock_input, capsys):
+    def test_prompt_non_empty_retry_on_empty(self, monkeypatch, capsys):
+        # Arrange - each input() call takes the next canned answer
+        answers = iter(["", "  ", "valid_input"])
+        monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
+        
         # Act
         result = _prompt_non_empty("Enter value: ")
         
-        # Assert
+        # Assert - all three answers were consumed
         assert result == "valid_input"
-        assert mock_input.call_count == 3
+        assert next(answers, None) is None
         captured = capsys.readouterr()
         assert "Error: This value is required" in captured.out
 
@@ -43,63 +240,116 @@ class TestPromptNonEmpty:
         assert result == "test"
 
 
-class TestExtractInstancesFromResponse:
-    def test_extract_instances_success(self):
-        # Arrange
-        response = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-123",
-                            "State": {"Name": "running"},
-                            "InstanceType": "t2.micro",
-                            "Placement": {"AvailabilityZone": "us-west-2a"}
-                        },
-                        {
-                            "InstanceId": "i-456",
-                            "State": {"Name": "stopped"},
-                            "InstanceType": "t2.small",
-                            "Placement": {"AvailabilityZone": "us-west-2b"}
-                        }
-                    ]
-                }
-            ]
-        }
+class TestPromptInstanceIds:
+    @patch.object(ic, '_prompt_non_empty', return_value="i-0123456789abcdef0")
+    def test_prompt_instance_ids_single(self, mock_prompt):
+        # Act
+        result = _prompt_instance_ids("IDs: ")
         
+        # Assert
+        assert result == ["i-0123456789abcdef0"]
+
+    @patch.object(
+        ic, '_prompt_non_empty',
+        return_value=" i-1111aaaa , i-2222bbbb,,i-3333cccc, "
+    )
+    def test_prompt_instance_ids_comma_separated(self, mock_prompt):
         # Act
-        result = _extract_instances_from_response(response)
+        result = _prompt_instance_ids("IDs: ")
         
         # Assert
-        assert len(result) == 2
-        assert result[0]["id"] == "i-123"
-        assert result[0]["state"] == "running"
-        assert result[0]["type"] == "t2.micro"
-        assert result[0]["az"] == "us-west-2a"
-        assert result[1]["id"] == "i-456"
-        assert result[1]["state"] == "stopped"
-
-    def test_extract_instances_empty_reservations(self):
-        # Arrange
-        response = {"Reservations": []}
+        assert result == ["i-1111aaaa", "i-2222bbbb", "i-3333cccc"]
+
+    @patch.object(ic, '_prompt_non_empty', side_effect=[",,", "i-1111aaaa"])
+    def test_prompt_instance_ids_retry_on_only_commas(self, mock_prompt, capsys):
+        # Act
+        result = _prompt_instance_ids("IDs: ")
         
+        # Assert
+        assert result == ["i-1111aaaa"]
+        assert mock_prompt.call_count == 2
+        captured = capsys.readouterr()
+        assert "At least one instance ID is required" in captured.out
+
+    @patch.object(
+        ic, '_prompt_non_empty',
+        side_effect=["i-1111aaaa, bogus", "i-1111aaaa, i-2222bbbb"]
+    )
+    def test_prompt_instance_ids_retry_on_malformed(self, mock_prompt, capsys):
         # Act
-        result = _extract_instances_from_response(response)
+        result = _prompt_instance_ids("IDs: ")
         
+        # Assert - the malformed token is reported and the user re-prompted
+        assert result == ["i-1111aaaa", "i-2222bbbb"]
+        assert mock_prompt.call_count == 2
+        captured = capsys.readouterr()
+        assert "'bogus' is not a valid instance ID" in captured.out
+
+    @pytest.mark.parametrize("instance_id", [
+        "i-1234567",             # too short
+        "i-0123456789ab",        # between the legacy and current lengths
+        "i-0123456789abcdef01",  # too long
+        "i-0123456789ABCDEF0",   # uppercase hex
+        "ami-12345678",          # wrong prefix
+    ])
+    def test_instance_id_pattern_rejects(self, instance_id):
         # Assert
-        assert result == []
+        assert _ID_RE.match(instance_id) is None
 
-    def test_extract_instances_no_reservations_key(self):
-        # Arrange
-        response = {}
+
+class TestResolveInstanceIds:
+    @patch('src.instances_cli._prompt_instance_ids')
+    def test_resolve_instance_ids_from_args(self, mock_prompt):
+        # Act
+        result = _resolve_instance_ids(
+            ("i-1111aaaa,i-2222bbbb", "i-3333cccc"), "IDs: "
+        )
         
+        # Assert - no prompt needed when arguments are valid
+        assert result == ["i-1111aaaa", "i-2222bbbb", "i-3333cccc"]
+        mock_prompt.assert_not_called()
+
+    @patch('src.instances_cli._prompt_instance_ids', return_value=["i-1111aaaa"])
+    def test_resolve_instance_ids_invalid_args_fall_back(self, mock_prompt, capsys):
         # Act
-        result = _extract_instances_from_response(response)
+        result = _resolve_instance_ids(("bogus",), "IDs: ")
         
         # Assert
-        assert result == []
+        assert result == ["i-1111aaaa"]
+        mock_prompt.assert_called_once_with("IDs: ")
+        captured = capsys.readouterr()
+        assert "'bogus' is not a valid instance ID" in captured.out
 
-    def test_extract_instances_multiple_reservations(self):
+    @patch('src.instances_cli._prompt_instance_ids', return_value=["i-1111aaaa"])
+    def test_resolve_instance_ids_no_args_prompts(self, mock_prompt):
+        # Act
+        result = _resolve_instance_ids((), "IDs: ")
+        
+        # Assert
+        assert result == ["i-1111aaaa"]
+        mock_prompt.assert_called_once_with("IDs: ")
+
+
+class TestIterInstances:
+    @pytest.mark.parametrize("response,expected_ids", _ITER_CASES)
+    def test_iter_instances_ids(self, response, expected_ids):
+        # Act
+        result = list(_iter_instances([response]))
+        
+        # Assert
+        assert [inst["id"] for inst in result] == expected_ids
+
+    def test_iter_instances_fields(self):
+        # Act
+        result = list(_iter_instances([_RESP_TWO_INSTANCES]))
+        
+        # Assert
+        assert result == [
+            {"id": "i-123", "state": "running", "type": "t2.micro", "az": "us-west-2a"},
+            {"id": "i-456", "state": "stopped", "type": "t2.small", "az": "us-west-2b"},
+        ]
+
+    def test_iter_instances_matches_jmespath_expression(self):
         # Arrange
         response = {
             "Reservations": [
@@ -113,46 +363,81 @@ class TestExtractInstancesFromResponse:
                         }
                     ]
                 },
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-222",
-                            "State": {"Name": "stopped"},
-                            "InstanceType": "t3.micro",
-                            "Placement": {"AvailabilityZone": "us-west-2b"}
-                        }
-                    ]
-                }
+                {"Instances": []}
             ]
         }
         
         # Act
-        result = _extract_instances_from_response(response)
+        direct = list(_iter_instances([response]))
+        via_jmespath = list(_iter_instances([response], _INSTANCE_EXPR))
         
-        # Assert
-        assert len(result) == 2
-        assert result[0]["id"] == "i-111"
-        assert result[1]["id"] == "i-222"
-
+        # Assert - the dict walk and the JMESPath projection agree
+        assert direct == via_jmespath
 
-class TestListInstances:
-    def test_list_instances_success(self, capsys):
+    def test_iter_instances_custom_expression(self):
         # Arrange
-        mock_client = Mock()
-        mock_client.describe_instances.return_value = {
+        response = {
             "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-test123",
-                            "State": {"Name": "running"},
-                            "InstanceType": "t2.micro",
-                            "Placement": {"AvailabilityZone": "us-west-2a"}
-                        }
-                    ]
-                }
+                {"Instances": [{"InstanceId": "i-111"}, {"InstanceId": "i-222"}]}
             ]
         }
+        expression = jmespath.compile("Reservations[].Instances[].InstanceId")
+        
+        # Act
+        result = list(_iter_instances([response, {}], expression))
+        
+        # Assert
+        assert result == ["i-111", "i-222"]
+
+    def test_iter_instances_is_lazy_across_pages(self):
+        # Arrange
+        first_page = _resp("i-111", "running", "t2.micro", "us-west-2a")
+        
+        def pages():
+            yield first_page
+            raise AssertionError("second page should not be fetched yet")
+        
+        # Act
+        result = _iter_instances(pages())
+        
+        # Assert - the first row is available before later pages are requested
+        assert next(result)["id"] == "i-111"
+
+
+class TestBuildFilters:
+    def test_build_filters_empty(self):
+        # Act & Assert
+        assert build_filters() == []
+
+    def test_build_filters_all_criteria(self):
+        # Act
+        result = build_filters(
+            state="running",
+            instance_type="t2.micro",
+            availability_zone="us-west-2a",
+            name_tag="web",
+        )
+        
+        # Assert
+        assert result == [
+            {"Name": "instance-state-name", "Values": ["running"]},
+            {"Name": "instance-type", "Values": ["t2.micro"]},
+            {"Name": "availability-zone", "Values": ["us-west-2a"]},
+            {"Name": "tag:Name", "Values": ["web"]},
+        ]
+
+    def test_build_filters_skips_blank_values(self):
+        # Act
+        result = build_filters(state="stopped", instance_type="", name_tag=None)
+        
+        # Assert
+        assert result == [{"Name": "instance-state-name", "Values": ["stopped"]}]
+
+
+class TestListInstances:
+    def test_list_instances_success(self, running_response, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages(running_response)
         
         # Act
         list_instances(mock_client)
@@ -160,41 +445,50 @@ class TestListInstances:
         # Assert
         captured = capsys.readouterr()
         assert "All Instances" in captured.out
-        assert "i-test123" in captured.out
+        assert "i-0123456789abcdef0" in captured.out
         assert "running" in captured.out
         assert "t2.micro" in captured.out
-        mock_client.describe_instances.assert_called_once()
+        mock_client.get_paginator.assert_called_once_with("describe_instances")
+        paginate = mock_client.get_paginator.return_value.paginate
+        assert paginate.call_count == 1
+        assert paginate.call_args.kwargs == {"PaginationConfig": {"PageSize": 100}}
 
-    def test_list_instances_with_state_filter(self, capsys):
+    def test_list_instances_with_state_filter(self, running_response, capsys):
         # Arrange
-        mock_client = Mock()
-        mock_client.describe_instances.return_value = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-running",
-                            "State": {"Name": "running"},
-                            "InstanceType": "t2.micro",
-                            "Placement": {"AvailabilityZone": "us-west-2a"}
-                        }
-                    ]
-                }
-            ]
-        }
+        mock_client = _mock_client_with_pages(running_response)
         
         # Act
-        list_instances(mock_client, state_filter="running")
+        list_instances(mock_client, filters=build_filters(state="running"))
         
         # Assert
         captured = capsys.readouterr()
         assert "state: running" in captured.out
-        assert "i-running" in captured.out
+        assert "i-0123456789abcdef0" in captured.out
+        paginate = mock_client.get_paginator.return_value.paginate
+        assert paginate.call_count == 1
+        assert paginate.call_args.kwargs == {
+            "Filters": [{"Name": "instance-state-name", "Values": ["running"]}],
+            "PaginationConfig": {"PageSize": 100},
+        }
 
-    def test_list_instances_empty_result(self, capsys):
+    def test_list_instances_multiple_pages(self, capsys):
         # Arrange
-        mock_client = Mock()
-        mock_client.describe_instances.return_value = {"Reservations": []}
+        first_page = _resp("i-page1", "running", "t2.micro", "us-west-2a")
+        second_page = _resp("i-page2", "stopped", "t3.micro", "us-west-2b")
+        mock_client = _mock_client_with_pages(first_page, second_page)
+        
+        # Act
+        list_instances(mock_client)
+        
+        # Assert - header printed once, rows from both pages shown
+        captured = capsys.readouterr()
+        assert captured.out.count("All Instances") == 1
+        assert "i-page1" in captured.out
+        assert "i-page2" in captured.out
+
+    def test_list_instances_empty_pages(self, empty_response, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages(empty_response, empty_response)
         
         # Act
         list_instances(mock_client)
@@ -202,25 +496,53 @@ class TestListInstances:
         # Assert
         captured = capsys.readouterr()
         assert "No instances found in this account or region" in captured.out
+        assert "All Instances" not in captured.out
 
-    def test_list_instances_empty_with_filter(self, capsys):
+    def test_list_instances_with_multiple_filters(self, empty_response, capsys):
         # Arrange
-        mock_client = Mock()
-        mock_client.describe_instances.return_value = {"Reservations": []}
+        mock_client = _mock_client_with_pages(empty_response)
+        filters = build_filters(state="running", instance_type="t2.micro")
         
         # Act
-        list_instances(mock_client, state_filter="stopped")
+        list_instances(mock_client, filters=filters)
+        
+        # Assert - every filter is pushed to the API and named in the message
+        captured = capsys.readouterr()
+        assert "state: running, type: t2.micro" in captured.out
+        paginate = mock_client.get_paginator.return_value.paginate
+        assert paginate.call_count == 1
+        assert paginate.call_args.kwargs == {
+            "Filters": filters,
+            "PaginationConfig": {"PageSize": 100},
+        }
+
+    def test_list_instances_empty_result(self, empty_response, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages(empty_response)
+        
+        # Act
+        list_instances(mock_client)
+        
+        # Assert
+        captured = capsys.readouterr()
+        assert "No instances found in this account or region" in captured.out
+
+    def test_list_instances_empty_with_filter(self, empty_response, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages(empty_response)
+        
+        # Act
+        list_instances(mock_client, filters=build_filters(state="stopped"))
         
         # Assert
         captured = capsys.readouterr()
-        assert "No instances found in state: stopped" in captured.out
+        assert "No instances found with state: stopped" in captured.out
 
     def test_list_instances_client_error(self, capsys):
         # Arrange
         mock_client = Mock()
-        error_response = {"Error": {"Code": "UnauthorizedOperation"}}
-        mock_client.describe_instances.side_effect = ClientError(
-            error_response, "DescribeInstances"
+        mock_client.get_paginator.return_value.paginate.side_effect = (
+            _ERR_UNAUTHORIZED
         )
         
         # Act
@@ -231,210 +553,551 @@ class TestListInstances:
         assert "Error: Failed to list instances" in captured.out
 
 
-class TestCreateInstance:
-    @patch('src.instances_cli._prompt_non_empty')
-    def test_create_instance_success(self, mock_prompt, capsys):
+class TestListInstancesCache:
+    def test_repeat_listing_uses_cache(self, capsys):
         # Arrange
-        mock_prompt.side_effect = ["ami-12345", "t2.micro"]
-        mock_client = Mock()
-        mock_client.run_instances.return_value = {
-            "Instances": [{"InstanceId": "i-newinstance"}]
-        }
+        mock_client = _mock_client_with_pages({"Reservations": []})
         
         # Act
-        create_instance(mock_client)
+        list_instances(mock_client)
+        list_instances(mock_client)
         
-        # Assert
-        captured = capsys.readouterr()
-        assert "Instance created with ID: i-newinstance" in captured.out
-        mock_client.run_instances.assert_called_once_with(
-            ImageId="ami-12345",
-            InstanceType="t2.micro",
-            MinCount=1,
-            MaxCount=1
-        )
+        # Assert - second call served from memory
+        assert mock_client.get_paginator.return_value.paginate.call_count == 1
 
-    @patch('src.instances_cli._prompt_non_empty')
-    def test_create_instance_client_error(self, mock_prompt, capsys):
+    def test_cache_key_ignores_filter_order(self, capsys):
         # Arrange
-        mock_prompt.side_effect = ["ami-invalid", "t2.micro"]
-        mock_client = Mock()
-        error_response = {"Error": {"Code": "InvalidAMIID.Malformed"}}
-        mock_client.run_instances.side_effect = ClientError(
-            error_response, "RunInstances"
-        )
+        mock_client = _mock_client_with_pages({"Reservations": []})
+        by_state = {"Name": "instance-state-name", "Values": ["running"]}
+        by_type = {"Name": "instance-type", "Values": ["t2.micro"]}
         
         # Act
-        create_instance(mock_client)
+        list_instances(mock_client, filters=[by_state, by_type])
+        list_instances(mock_client, filters=[by_type, by_state])
+        list_instances(mock_client, filters=[by_state])
+        
+        # Assert - same criteria share an entry, different criteria do not
+        assert mock_client.get_paginator.return_value.paginate.call_count == 2
+
+    @patch('src.instances_cli.time.monotonic')
+    def test_cache_expires_after_ttl(self, mock_time, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages({"Reservations": []})
+        mock_time.return_value = 100.0
+        
+        # Act
+        list_instances(mock_client)
+        mock_time.return_value = 111.0
+        list_instances(mock_client)
         
         # Assert
-        captured = capsys.readouterr()
-        assert "Error: Failed to create instance" in captured.out
+        assert mock_client.get_paginator.return_value.paginate.call_count == 2
 
+    def test_cache_ignores_entry_from_other_client(self, capsys):
+        # Arrange - a dead client's entry under the new client's id, as
+        # happens when CPython reuses the id after garbage collection
+        stale_client = _mock_client_with_pages(_RESP_ONE_RUNNING)
+        list_instances(stale_client)
+        new_client = _mock_client_with_pages({"Reservations": []})
+        stale_entry = ic._DESCRIBE_CACHE.pop(ic._cache_key(stale_client, None))
+        ic._DESCRIBE_CACHE[ic._cache_key(new_client, None)] = stale_entry
+        capsys.readouterr()
+        
+        # Act
+        list_instances(new_client)
+        
+        # Assert - the new client fetches its own listing
+        assert new_client.get_paginator.return_value.paginate.call_count == 1
+        assert "No instances found" in capsys.readouterr().out
 
-class TestStopInstance:
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-test123")
-    def test_stop_instance_success(self, mock_prompt, capsys):
+    @patch('src.instances_cli.time.monotonic')
+    def test_refreshed_entry_is_not_evicted_first(self, mock_time, capsys):
+        # Arrange - fill the cache, oldest entry first
+        mock_time.return_value = 100.0
+        mock_client = _mock_client_with_pages({"Reservations": []})
+        states = ["s0", "s1", "s2", "s3", "s4", "s5", "s6", "s7"]
+        for state in states:
+            list_instances(mock_client, filters=build_filters(state=state))
+        
+        # Act - s0 expires and is refetched, then one new query is added
+        mock_time.return_value = 105.0
+        ic._DESCRIBE_CACHE[ic._cache_key(
+            mock_client, build_filters(state="s0")
+        )] = (100.0, mock_client, [])
+        list_instances(mock_client, filters=build_filters(state="s0"))
+        list_instances(mock_client, filters=build_filters(state="s8"))
+        
+        # Assert - s1 is now the oldest and was evicted; s0 is still cached
+        cached_states = [key[1][0][1][0] for key in ic._DESCRIBE_CACHE]
+        assert cached_states == ["s2", "s3", "s4", "s5", "s6", "s7", "s0", "s8"]
+
+    def test_cache_evicts_oldest_entry(self, capsys):
+        # Arrange
+        mock_client = _mock_client_with_pages({"Reservations": []})
+        states = ["s0", "s1", "s2", "s3", "s4", "s5", "s6", "s7", "s8"]
+        
+        # Act - one more distinct query than the cache holds
+        for state in states:
+            list_instances(mock_client, filters=build_filters(state=state))
+        list_instances(mock_client, filters=build_filters(state="s8"))
+        list_instances(mock_client, filters=build_filters(state="s0"))
+        
+        # Assert - newest entry still cached, oldest refetched
+        assert mock_client.get_paginator.return_value.paginate.call_count == 10
+
+    def test_failed_listing_is_not_cached(self, capsys):
         # Arrange
         mock_client = Mock()
+        mock_client.get_paginator.return_value.paginate.side_effect = [
+            _ERR_THROTTLING,
+            [{"Reservations": []}],
+        ]
         
         # Act
-        stop_instance(mock_client)
+        list_instances(mock_client)
+        list_instances(mock_client)
         
         # Assert
         captured = capsys.readouterr()
-        assert "Stop request sent for instance i-test123" in captured.out
-        mock_client.stop_instances.assert_called_once_with(
-            InstanceIds=["i-test123"]
-        )
+        assert "No instances found" in captured.out
+        assert mock_client.get_paginator.return_value.paginate.call_count == 2
 
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-invalid")
-    def test_stop_instance_client_error(self, mock_prompt, capsys):
+    @patch.object(ic, '_prompt_non_empty', return_value="i-0123456789abcdef0")
+    def test_lifecycle_action_clears_cache(self, mock_prompt, capsys):
         # Arrange
-        mock_client = Mock()
-        error_response = {"Error": {"Code": "InvalidInstanceID.NotFound"}}
-        mock_client.stop_instances.side_effect = ClientError(
-            error_response, "StopInstances"
-        )
+        mock_client = _mock_client_with_pages({"Reservations": []})
+        list_instances(mock_client)
         
         # Act
         stop_instance(mock_client)
+        list_instances(mock_client)
         
-        # Assert
-        captured = capsys.readouterr()
-        assert "Error: Failed to stop instance" in captured.out
+        # Assert - listing after a stop is fetched fresh
+        assert mock_client.get_paginator.return_value.paginate.call_count == 2
+
 
+class TestGetEnabledRegions:
+    def test_get_enabled_regions_sorted(self):
+        # Arrange
+        mock_client = Mock()
+        mock_client.describe_regions.return_value = {
+            "Regions": [{"RegionName": "us-west-2"}, {"RegionName": "eu-west-1"}]
+        }
+        
+        # Act & Assert
+        assert get_enabled_regions(mock_client) == ["eu-west-1", "us-west-2"]
 
-class TestStartInstance:
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-test456")
-    def test_start_instance_success(self, mock_prompt, capsys):
+    def test_get_enabled_regions_client_error(self, capsys):
         # Arrange
         mock_client = Mock()
+        mock_client.describe_regions.side_effect = _ERR_UNAUTHORIZED
         
+        # Act & Assert
+        assert get_enabled_regions(mock_client) == []
+        captured = capsys.readouterr()
+        assert "Error: Failed to list regions" in captured.out
+
+
+class TestResolveRegions:
+    @pytest.fixture
+    def regions_client(self):
+        mock_client = Mock()
+        mock_client.describe_regions.return_value = {
+            "Regions": [{"RegionName": "us-west-2"}, {"RegionName": "eu-west-1"}]
+        }
+        return mock_client
+
+    def test_no_arguments_uses_enabled_regions(self, regions_client):
+        # Act & Assert
+        assert resolve_regions(regions_client) == ["eu-west-1", "us-west-2"]
+
+    def test_arguments_split_on_spaces_and_commas(self, regions_client):
         # Act
-        start_instance(mock_client)
+        result = resolve_regions(regions_client, "us-west-2,", " eu-west-1")
+        
+        # Assert - order given by the user is kept
+        assert result == ["us-west-2", "eu-west-1"]
+
+    def test_unknown_region_reported_and_skipped(self, regions_client, capsys):
+        # Act
+        result = resolve_regions(regions_client, "bogus-1,us-west-2")
         
         # Assert
-        captured = capsys.readouterr()
-        assert "Start request sent for instance i-test456" in captured.out
-        mock_client.start_instances.assert_called_once_with(
-            InstanceIds=["i-test456"]
-        )
+        assert result == ["us-west-2"]
+        assert "Error: Not an enabled region: bogus-1" in capsys.readouterr().out
+
+    def test_only_unknown_regions(self, regions_client, capsys):
+        # Act & Assert
+        assert resolve_regions(regions_client, "bogus-1", "bogus-2") == []
+        assert "bogus-1, bogus-2" in capsys.readouterr().out
 
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-invalid")
-    def test_start_instance_client_error(self, mock_prompt, capsys):
+    def test_region_lookup_failure(self, capsys):
         # Arrange
         mock_client = Mock()
-        error_response = {"Error": {"Code": "InvalidInstanceID.NotFound"}}
-        mock_client.start_instances.side_effect = ClientError(
-            error_response, "StartInstances"
+        mock_client.describe_regions.side_effect = _ERR_UNAUTHORIZED
+        
+        # Act & Assert - nothing to validate against, so nothing is listed
+        assert resolve_regions(mock_client, "us-west-2") == []
+        assert "Error: Failed to list regions" in capsys.readouterr().out
+
+
+class TestListInstancesInRegions:
+    def test_list_instances_in_regions_success(self, capsys):
+        # Arrange
+        east = _mock_client_with_pages(
+            _resp("i-east", "running", "t2.micro", "us-east-1a")
+        )
+        west = _mock_client_with_pages({"Reservations": []})
+        
+        # Act
+        list_instances_in_regions({"us-east-1": east, "us-west-2": west})
+        
+        # Assert - regions reported in the order given
+        captured = capsys.readouterr()
+        assert "Instances in 2 region(s)" in captured.out
+        assert "[us-east-1] 1 instance(s)" in captured.out
+        assert "i-east" in captured.out
+        assert "[us-west-2] 0 instance(s)" in captured.out
+        assert captured.out.index("us-east-1") < captured.out.index("us-west-2")
+
+    def test_list_instances_in_regions_one_region_fails(self, capsys):
+        # Arrange
+        failing = Mock()
+        failing.get_paginator.return_value.paginate.side_effect = (
+            _ERR_AUTH_FAILURE
         )
+        working = _mock_client_with_pages({"Reservations": []})
         
         # Act
-        start_instance(mock_client)
+        list_instances_in_regions({"ap-east-1": failing, "us-west-2": working})
+        
+        # Assert - the failure is reported and other regions still listed
+        captured = capsys.readouterr()
+        assert "[ap-east-1] Error: Failed to list instances" in captured.out
+        assert "[us-west-2] 0 instance(s)" in captured.out
+
+    def test_list_instances_in_regions_unreachable_endpoint(self, capsys):
+        # Arrange - e.g. a mistyped region or a network failure
+        failing = Mock()
+        failing.get_paginator.return_value.paginate.side_effect = (
+            EndpointConnectionError(endpoint_url="https://ec2.bogus-1.amazonaws.com")
+        )
+        working = _mock_client_with_pages(
+            _resp("i-west", "running", "t2.micro", "us-west-2a")
+        )
+        
+        # Act
+        list_instances_in_regions({"bogus-1": failing, "us-west-2": working})
+        
+        # Assert - the healthy region is still listed
+        captured = capsys.readouterr()
+        assert "[bogus-1] Error: Failed to list instances" in captured.out
+        assert "Could not connect to the endpoint URL" in captured.out
+        assert "Hint:" not in captured.out
+        assert "[us-west-2] 1 instance(s)" in captured.out
+        assert "i-west" in captured.out
+
+    def test_list_instances_in_regions_empty(self, capsys):
+        # Act
+        list_instances_in_regions({})
         
         # Assert
         captured = capsys.readouterr()
-        assert "Error: Failed to start instance" in captured.out
+        assert "No regions to list" in captured.out
 
 
-class TestRebootInstance:
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-test789")
-    def test_reboot_instance_success(self, mock_prompt, capsys):
+class TestPrintErrorDetails:
+    @pytest.mark.parametrize("code,hint", [
+        ("InvalidInstanceID.NotFound", "Hint: Check the instance ID(s)"),
+        ("InvalidInstanceID.Malformed", "Hint: Instance IDs are i- followed by 8 or 17"),
+        ("IncorrectInstanceState", "Hint: The instance is not in a state"),
+        ("UnauthorizedOperation", "Hint: Your IAM permissions"),
+        ("InvalidAMIID.Malformed", "Hint: AMI IDs look like"),
+        ("SomethingUnexpected", None),
+    ])
+    def test_print_error_details(self, code, hint, capsys):
         # Arrange
-        mock_client = Mock()
+        exc = ClientError({"Error": {"Code": code}}, "Operation")
         
         # Act
-        reboot_instance(mock_client)
+        _print_error_details(exc)
         
-        # Assert
+        # Assert - details always shown, hint only for known codes
         captured = capsys.readouterr()
-        assert "Reboot request sent for instance i-test789" in captured.out
-        mock_client.reboot_instances.assert_called_once_with(
-            InstanceIds=["i-test789"]
+        assert f"Details: {exc}" in captured.out
+        if hint is None:
+            assert "Hint:" not in captured.out
+        else:
+            assert hint in captured.out
+
+    def test_print_error_details_without_code(self, capsys):
+        # Act
+        _print_error_details(ClientError({}, "Operation"))
+        
+        # Assert
+        assert "Hint:" not in capsys.readouterr().out
+
+
+class TestCreateInstance:
+    @patch.object(ic, '_prompt_non_empty')
+    def test_create_instance_success(self, mock_prompt, outcomes):
+        # Arrange
+        mock_prompt.side_effect = ["ami-12345", "t2.micro"]
+        fake_client = FakeEC2(run_instances_response={
+            "Instances": [{"InstanceId": "i-newinstance"}]
+        })
+        
+        # Act
+        create_instance(fake_client)
+        
+        # Assert
+        (record,) = outcomes.records
+        assert record.getMessage() == "Success: Instance created with ID: i-newinstance"
+        assert record.instance_ids == ["i-newinstance"]
+        fake_client.assert_called_once_with(
+            "run_instances",
+            ImageId="ami-12345",
+            InstanceType="t2.micro",
+            MinCount=1,
+            MaxCount=1
         )
 
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-invalid")
-    def test_reboot_instance_client_error(self, mock_prompt, capsys):
+    @patch.object(ic, '_prompt_non_empty')
+    def test_create_instance_with_args(self, mock_prompt, capsys):
         # Arrange
-        mock_client = Mock()
-        error_response = {"Error": {"Code": "InvalidInstanceID.NotFound"}}
-        mock_client.reboot_instances.side_effect = ClientError(
-            error_response, "RebootInstances"
+        fake_client = FakeEC2(run_instances_response={
+            "Instances": [{"InstanceId": "i-newinstance"}]
+        })
+        
+        # Act
+        create_instance(fake_client, "ami-12345", "t3.micro")
+        
+        # Assert - arguments given inline skip the prompts
+        mock_prompt.assert_not_called()
+        fake_client.assert_called_once_with(
+            "run_instances",
+            ImageId="ami-12345",
+            InstanceType="t3.micro",
+            MinCount=1,
+            MaxCount=1
         )
+
+    @patch.object(ic, '_prompt_non_empty')
+    def test_create_instance_client_error(self, mock_prompt, outcomes):
+        # Arrange
+        mock_prompt.side_effect = ["ami-invalid", "t2.micro"]
+        fake_client = FakeEC2(errors={"run_instances": _ERR_AMI_MALFORMED})
         
         # Act
-        reboot_instance(mock_client)
+        create_instance(fake_client)
         
         # Assert
-        captured = capsys.readouterr()
-        assert "Error: Failed to reboot instance" in captured.out
+        (record,) = outcomes.records
+        assert record.levelno == logging.ERROR
+        assert record.getMessage() == "Error: Failed to create instance."
+        assert record.error_code == "InvalidAMIID.Malformed"
 
 
-class TestTerminateInstance:
-    @patch('builtins.input', return_value="yes")
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-terminate")
-    def test_terminate_instance_confirmed(self, mock_prompt, mock_input, capsys):
+class TestStopInstance:
+    @pytest.mark.parametrize("prompt", ["i-1111aaaa, i-2222bbbb"], indirect=True)
+    def test_stop_instance_multiple_ids(self, prompt, outcomes):
         # Arrange
-        mock_client = Mock()
+        fake_client = FakeEC2()
         
         # Act
-        terminate_instance(mock_client)
+        stop_instance(fake_client)
         
-        # Assert
-        captured = capsys.readouterr()
-        assert "Terminate request sent for instance i-terminate" in captured.out
-        mock_client.terminate_instances.assert_called_once_with(
-            InstanceIds=["i-terminate"]
+        # Assert - all IDs are sent in a single request
+        (record,) = outcomes.records
+        assert record.getMessage() == (
+            "Success: Stop request sent for instances i-1111aaaa, i-2222bbbb"
+        )
+        assert record.instance_ids == ["i-1111aaaa", "i-2222bbbb"]
+        fake_client.assert_called_once_with(
+            "stop_instances",
+            InstanceIds=["i-1111aaaa", "i-2222bbbb"]
         )
 
-    @patch('builtins.input', return_value="no")
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-safe")
-    def test_terminate_instance_cancelled(self, mock_prompt, mock_input, capsys):
+    @patch.object(ic, '_prompt_non_empty')
+    def test_stop_instance_with_args(self, mock_prompt, capsys):
         # Arrange
-        mock_client = Mock()
+        fake_client = FakeEC2()
         
         # Act
-        terminate_instance(mock_client)
+        stop_instance(fake_client, "i-1111aaaa,i-2222bbbb")
         
         # Assert
-        captured = capsys.readouterr()
-        assert "Termination cancelled" in captured.out
-        mock_client.terminate_instances.assert_not_called()
+        mock_prompt.assert_not_called()
+        fake_client.assert_called_once_with(
+            "stop_instances",
+            InstanceIds=["i-1111aaaa", "i-2222bbbb"]
+        )
+
 
-    @patch('builtins.input', return_value="YES")
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-terminate2")
-    def test_terminate_instance_case_insensitive(
-        self, mock_prompt, mock_input, capsys
+class TestTerminateInstance:
+    @pytest.mark.parametrize("prompt", ["i-0bbbbbbbbbbbbbbb2"], indirect=True)
+    @pytest.mark.parametrize("confirm,called,raises", [
+        ("yes", True, False),   # confirmed
+        ("no", False, False),   # cancelled
+        ("YES", True, False),   # confirmation is case-insensitive
+        ("yes", True, True),    # confirmed, but the API call fails
+    ])
+    def test_terminate_instance(
+        self, confirm, called, raises, prompt, monkeypatch, capsys, outcomes
     ):
         # Arrange
-        mock_client = Mock()
+        monkeypatch.setattr("builtins.input", lambda _prompt: confirm)
+        errors = {"terminate_instances": _ERR_NOT_FOUND} if raises else None
+        fake_client = FakeEC2(errors=errors)
         
         # Act
-        terminate_instance(mock_client)
+        terminate_instance(fake_client)
         
-        # Assert - YES should be converted to lowercase and match "yes"
-        captured = capsys.readouterr()
-        assert "Terminate request sent for instance i-terminate2" in captured.out
-        mock_client.terminate_instances.assert_called_once_with(
-            InstanceIds=["i-terminate2"]
+        # Assert
+        if not called:
+            assert fake_client.calls == []
+            assert "Termination cancelled" in capsys.readouterr().out
+            assert outcomes.records == []
+            return
+        fake_client.assert_called_once_with(
+            "terminate_instances",
+            InstanceIds=["i-0bbbbbbbbbbbbbbb2"]
         )
+        (record,) = outcomes.records
+        assert record.action == "terminate"
+        assert record.levelno == (logging.ERROR if raises else logging.INFO)
+
 
-    @patch('builtins.input', return_value="yes")
-    @patch('src.instances_cli._prompt_non_empty', return_value="i-invalid")
-    def test_terminate_instance_client_error(
-        self, mock_prompt, mock_input, capsys
+class TestLifecycleSuccess:
+    @pytest.mark.parametrize("prompt", ["i-0123456789abcdef0"], indirect=True)
+    @pytest.mark.parametrize("action,client_method,success_msg", [
+        (stop_instance, "stop_instances", "Success: Stop request sent"),
+        (start_instance, "start_instances", "Success: Start request sent"),
+        (reboot_instance, "reboot_instances", "Success: Reboot request sent"),
+    ])
+    def test_lifecycle_action_success(
+        self, action, client_method, success_msg, prompt, outcomes
     ):
         # Arrange
-        mock_client = Mock()
-        error_response = {"Error": {"Code": "InvalidInstanceID.NotFound"}}
-        mock_client.terminate_instances.side_effect = ClientError(
-            error_response, "TerminateInstances"
+        fake_client = FakeEC2()
+        
+        # Act
+        action(fake_client)
+        
+        # Assert
+        (record,) = outcomes.records
+        assert record.getMessage() == f"{success_msg} for instance i-0123456789abcdef0"
+        assert record.instance_ids == ["i-0123456789abcdef0"]
+        fake_client.assert_called_once_with(
+            client_method, InstanceIds=["i-0123456789abcdef0"]
         )
+
+
+class TestLifecycleClientError:
+    @pytest.mark.parametrize("prompt", ["i-00000000deadbeef0"], indirect=True)
+    @pytest.mark.parametrize("action,client_method,expected_msg", [
+        (stop_instance, "stop_instances", "Error: Failed to stop instance"),
+        (start_instance, "start_instances", "Error: Failed to start instance"),
+        (reboot_instance, "reboot_instances", "Error: Failed to reboot instance"),
+        (
+            terminate_instance,
+            "terminate_instances",
+            "Error: Failed to terminate instance",
+        ),
+    ])
+    def test_lifecycle_action_client_error(
+        self, action, client_method, expected_msg, prompt, monkeypatch, outcomes
+    ):
+        # Arrange - terminate also asks for confirmation
+        monkeypatch.setattr("builtins.input", lambda _prompt: "yes")
+        fake_client = FakeEC2(errors={client_method: _ERR_NOT_FOUND})
         
         # Act
-        terminate_instance(mock_client)
+        action(fake_client)
         
         # Assert
-        captured = capsys.readouterr()
-        assert "Error: Failed to terminate instance" in captured.out
+        (record,) = outcomes.records
+        assert record.levelno == logging.ERROR
+        assert record.getMessage() == f"{expected_msg} i-00000000deadbeef0"
+        assert record.error_code == "InvalidInstanceID.NotFound"
+        fake_client.assert_called_once_with(
+            client_method, InstanceIds=["i-00000000deadbeef0"]
+        )
+
+
+class TestLifecycleIntegration:
+    # Also present in moto's default catalogue, so the test still works if
+    # another test imported moto's EC2 models before MOTO_AMIS_PATH was set
+    AMI_ID = "ami-12c6146b"
+
+    @pytest.fixture
+    def ec2_client(self, monkeypatch, tmp_path):
+        # boto3 and moto are only needed here; importing them lazily keeps
+        # them (roughly 0.2s) out of collection and the mock-based tests
+        boto3 = pytest.importorskip("boto3")
+        mock_aws = pytest.importorskip("moto").mock_aws
+        # Fake credentials so nothing can ever reach a real AWS account
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+        # A one-image catalogue instead of moto's ~1,200 default AMIs, which
+        # it otherwise parses and builds on first use
+        amis_path = tmp_path / "amis.json"
+        amis_path.write_text(json.dumps([{
+            "ami_id": self.AMI_ID,
+            "name": "test-ami",
+            "description": "Test AMI",
+            "owner_id": "123456789012",
+            "public": True,
+            "virtualization_type": "hvm",
+            "architecture": "x86_64",
+            "state": "available",
+            "image_type": "machine",
+            "hypervisor": "xen",
+            "root_device_name": "/dev/xvda",
+            "root_device_type": "ebs",
+        }]))
+        monkeypatch.setenv("MOTO_AMIS_PATH", str(amis_path))
+        # The client is built inside the mock, so the default boto3
+        # session does not need resetting on entry
+        with mock_aws(config={"core": {"reset_boto3_session": False}}):
+            yield boto3.client("ec2", region_name="us-east-1")
+
+    @staticmethod
+    def _states(client):
+        response = client.describe_instances()
+        return {inst["id"]: inst["state"] for inst in _iter_instances([response])}
+
+    def test_full_lifecycle(self, ec2_client, monkeypatch, capsys, outcomes):
+        # Arrange
+        monkeypatch.setattr("builtins.input", lambda _prompt: "yes")
+        
+        # Act & Assert - create
+        create_instance(ec2_client, self.AMI_ID, "t2.micro")
+        (instance_id,) = self._states(ec2_client)
+        assert outcomes.records[-1].instance_ids == [instance_id]
+        
+        # list
+        list_instances(ec2_client)
+        assert instance_id in capsys.readouterr().out
+        
+        # stop
+        stop_instance(ec2_client, instance_id)
+        assert outcomes.records[-1].action == "stop"
+        assert self._states(ec2_client)[instance_id] == "stopped"
+        
+        # start
+        start_instance(ec2_client, instance_id)
+        assert outcomes.records[-1].action == "start"
+        assert self._states(ec2_client)[instance_id] == "running"
+        
+        # reboot
+        reboot_instance(ec2_client, instance_id)
+        assert outcomes.records[-1].action == "reboot"
+        assert self._states(ec2_client)[instance_id] == "running"
+        
+        # terminate (confirmed)
+        terminate_instance(ec2_client, instance_id)
+        assert outcomes.records[-1].action == "terminate"
+        assert self._states(ec2_client)[instance_id] == "terminated"
+        assert all(r.levelno == logging.INFO for r in outcomes.records)
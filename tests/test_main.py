@@ -0,0 +1,326 @@
+import logging
+import pytest
+from unittest.mock import Mock, patch
+from src import main as cli
+from src.instances_cli import build_filters, logger as instances_logger
+
+# Kept before the autouse fixture below replaces it on the module
+_configure_logging = cli._configure_logging
+
+
+@pytest.fixture(autouse=True)
+def no_logging_setup(monkeypatch):
+    # main() attaches a stdout handler to the shared instances_cli logger;
+    # skip it so caplog-based tests elsewhere are not affected
+    monkeypatch.setattr(cli, "_configure_logging", lambda: None)
+
+
+@pytest.fixture
+def ec2_client(monkeypatch):
+    client = Mock()
+    monkeypatch.setattr(cli, "create_ec2_client", lambda *args: client)
+    return client
+
+
+@pytest.fixture
+def run_menu(monkeypatch, ec2_client):
+    """Run main() with the given menu lines, then exit with option 0."""
+    prompts = []
+
+    def run(*lines):
+        answers = iter(lines + ("0",))
+
+        def fake_input(prompt):
+            prompts.append(prompt)
+            return next(answers)
+
+        monkeypatch.setattr("builtins.input", fake_input)
+        cli.main()
+        return prompts
+
+    return run
+
+
+class TestMainLoop:
+    def test_dispatch_passes_arguments(self, run_menu, ec2_client):
+        # Arrange
+        handler = Mock()
+
+        # Act
+        with patch.dict(cli._DISPATCH, {"3": handler}):
+            run_menu("3 i-a,i-b")
+
+        # Assert
+        handler.assert_called_once_with(ec2_client, "i-a,i-b")
+
+    def test_quoted_argument_kept_together(self, run_menu, ec2_client):
+        # Arrange
+        handler = Mock()
+
+        # Act
+        with patch.dict(cli._DISPATCH, {"7": handler}):
+            run_menu('7 running "" "" "web server"')
+
+        # Assert
+        handler.assert_called_once_with(ec2_client, "running", "", "", "web server")
+
+    @pytest.mark.parametrize("line,expected", [
+        ("1 extra", "option 1 takes no arguments"),
+        ("8 extra", "option 8 takes no arguments"),
+        ("2 ami-1 t2.micro extra", "option 2 takes at most 2 argument(s)"),
+        ("7 a b c d e", "option 7 takes at most 4 argument(s)"),
+    ])
+    def test_extra_arguments_rejected(self, line, expected, run_menu, capsys):
+        # Arrange
+        handler = Mock()
+        option = line.split()[0]
+
+        # Act
+        with patch.dict(cli._DISPATCH, {option: handler}):
+            run_menu(line)
+
+        # Assert
+        assert expected in capsys.readouterr().out
+        handler.assert_not_called()
+
+    def test_unlimited_arguments_accepted(self, run_menu, ec2_client):
+        # Arrange - instance IDs may be space-separated
+        handler = Mock()
+
+        # Act
+        with patch.dict(cli._DISPATCH, {"3": handler}):
+            run_menu("3 i-a i-b i-c i-d i-e")
+
+        # Assert
+        handler.assert_called_once_with(ec2_client, "i-a", "i-b", "i-c", "i-d", "i-e")
+
+    @pytest.mark.parametrize("line,expected", [
+        ('3 "i-abc', "Error: Could not parse input"),   # unterminated quote
+        ("", "Error: '' is not a valid option."),
+        ("   ", "Error: '' is not a valid option."),
+        ("42", "Error: '42' is not a valid option."),
+    ])
+    def test_invalid_input_reported(self, line, expected, run_menu, capsys):
+        # Act
+        run_menu(line)
+
+        # Assert - the loop carries on to the exit option
+        captured = capsys.readouterr()
+        assert expected in captured.out
+        assert "Goodbye!" in captured.out
+
+    def test_client_setup_failure_exits(self, monkeypatch):
+        # Arrange
+        def fail(*args):
+            raise SystemExit(1)
+        monkeypatch.setattr(cli, "create_ec2_client", fail)
+        mock_input = Mock()
+        monkeypatch.setattr("builtins.input", mock_input)
+
+        # Act
+        cli.main()
+
+        # Assert - main returns without showing the menu prompt
+        mock_input.assert_not_called()
+
+    def test_keyboard_interrupt_exits(self, monkeypatch, ec2_client, capsys):
+        # Arrange
+        monkeypatch.setattr("builtins.input", Mock(side_effect=KeyboardInterrupt))
+
+        # Act
+        cli.main()
+
+        # Assert
+        assert "Operation cancelled by user" in capsys.readouterr().out
+
+    def test_unexpected_error_keeps_loop_running(self, run_menu, capsys):
+        # Arrange
+        handler = Mock(side_effect=RuntimeError("boom"))
+
+        # Act
+        with patch.dict(cli._DISPATCH, {"1": handler}):
+            run_menu("1", "1")
+
+        # Assert
+        captured = capsys.readouterr()
+        assert captured.out.count("Unexpected error: boom") == 2
+        assert "Goodbye!" in captured.out
+
+
+class TestHandleFilterByState:
+    def test_arguments_skip_prompts(self, run_menu, monkeypatch, ec2_client):
+        # Arrange
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        prompts = run_menu("7 running t2.micro")
+
+        # Assert - only the menu prompt was shown
+        assert set(prompts) == {"Select an option: "}
+        mock_list.assert_called_once_with(
+            ec2_client,
+            filters=build_filters(state="running", instance_type="t2.micro"),
+        )
+
+    def test_state_argument_is_lowercased(self, monkeypatch, ec2_client, capsys):
+        # Arrange
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        cli.handle_filter_by_state(ec2_client, "RUNNING")
+
+        # Assert
+        assert mock_list.call_args.kwargs["filters"] == build_filters(state="running")
+        assert "might not be a valid state" not in capsys.readouterr().out
+
+    def test_unknown_state_warns_but_proceeds(self, monkeypatch, ec2_client, capsys):
+        # Arrange
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        cli.handle_filter_by_state(ec2_client, "sleeping")
+
+        # Assert
+        assert "'sleeping' might not be a valid state" in capsys.readouterr().out
+        mock_list.assert_called_once()
+
+    def test_prompts_without_arguments(self, monkeypatch, ec2_client):
+        # Arrange - state, type (skipped), AZ, Name tag (skipped)
+        answers = iter(["Stopped", "", "us-west-2a", ""])
+        monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        cli.handle_filter_by_state(ec2_client)
+
+        # Assert
+        mock_list.assert_called_once_with(
+            ec2_client,
+            filters=build_filters(state="stopped", availability_zone="us-west-2a"),
+        )
+
+    def test_empty_state_rejected(self, monkeypatch, ec2_client, capsys):
+        # Arrange
+        monkeypatch.setattr("builtins.input", lambda _prompt: "  ")
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        cli.handle_filter_by_state(ec2_client)
+
+        # Assert
+        assert "State cannot be empty" in capsys.readouterr().out
+        mock_list.assert_not_called()
+
+
+class TestHandleAllRegions:
+    def test_clients_built_per_region(self, monkeypatch, ec2_client):
+        # Arrange
+        monkeypatch.setattr(
+            cli, "resolve_regions", lambda client, *args: ["eu-west-1", "us-west-2"]
+        )
+        monkeypatch.setattr(cli, "create_ec2_client", lambda region: f"client-{region}")
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances_in_regions", mock_list)
+
+        # Act
+        cli.handle_all_regions(ec2_client, "eu-west-1,us-west-2")
+
+        # Assert
+        mock_list.assert_called_once_with(
+            {"eu-west-1": "client-eu-west-1", "us-west-2": "client-us-west-2"}
+        )
+
+    def test_no_regions_left(self, monkeypatch, ec2_client):
+        # Arrange
+        monkeypatch.setattr(cli, "resolve_regions", lambda client, *args: [])
+        mock_create = Mock()
+        monkeypatch.setattr(cli, "create_ec2_client", mock_create)
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances_in_regions", mock_list)
+
+        # Act
+        cli.handle_all_regions(ec2_client, "bogus-1")
+
+        # Assert - no client is built for a region that failed validation
+        mock_create.assert_not_called()
+        mock_list.assert_not_called()
+
+    def test_client_setup_failure_aborts(self, monkeypatch, ec2_client):
+        # Arrange - create_ec2_client prints its reason and exits
+        monkeypatch.setattr(cli, "resolve_regions", lambda client, *args: ["eu-west-1"])
+        monkeypatch.setattr(
+            cli, "create_ec2_client", Mock(side_effect=SystemExit(1))
+        )
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances_in_regions", mock_list)
+
+        # Act - must return normally instead of ending the whole CLI
+        cli.handle_all_regions(ec2_client)
+
+        # Assert
+        mock_list.assert_not_called()
+
+
+class TestSimpleHandlers:
+    def test_list_all(self, monkeypatch, ec2_client):
+        # Arrange
+        mock_list = Mock()
+        monkeypatch.setattr(cli, "list_instances", mock_list)
+
+        # Act
+        cli.handle_list_all(ec2_client)
+
+        # Assert
+        mock_list.assert_called_once_with(ec2_client)
+
+    def test_refresh_clears_cache(self, monkeypatch, ec2_client, capsys):
+        # Arrange
+        mock_clear = Mock()
+        monkeypatch.setattr(cli, "clear_instance_cache", mock_clear)
+
+        # Act
+        cli.handle_refresh(ec2_client)
+
+        # Assert
+        mock_clear.assert_called_once_with()
+        assert "Cached instance listings cleared" in capsys.readouterr().out
+
+
+class TestConfigureLogging:
+    @pytest.fixture
+    def clean_logger(self):
+        # Restore the shared logger so caplog-based tests still see records
+        handlers = instances_logger.handlers[:]
+        level = instances_logger.level
+        propagate = instances_logger.propagate
+        instances_logger.handlers.clear()
+        yield instances_logger
+        instances_logger.handlers[:] = handlers
+        instances_logger.setLevel(level)
+        instances_logger.propagate = propagate
+
+    def test_outcomes_printed_to_stdout(self, clean_logger, capsys):
+        # Act
+        _configure_logging()
+        clean_logger.info("Success: Stop request sent for instance i-1111aaaa")
+
+        # Assert - plain message on stdout, nothing on stderr
+        captured = capsys.readouterr()
+        assert captured.out == "Success: Stop request sent for instance i-1111aaaa\n"
+        assert captured.err == ""
+
+    def test_repeated_calls_add_one_handler(self, clean_logger, capsys):
+        # Act
+        _configure_logging()
+        _configure_logging()
+        clean_logger.error("Error: Failed to stop instance i-1111aaaa")
+
+        # Assert - every outcome line printed once
+        assert len(clean_logger.handlers) == 1
+        assert capsys.readouterr().out.count("Error: Failed to stop") == 1
+        assert clean_logger.level == logging.INFO